@@ -1,8 +1,9 @@
+import asyncio
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from neo4j import GraphDatabase
-from rdflib import Graph, Namespace, URIRef, Literal
+from neo4j import AsyncGraphDatabase
+from rdflib import Graph, Namespace, Literal
 
 load_dotenv()
 
@@ -13,57 +14,156 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "neo4j")
 ROOT = Path(__file__).resolve().parents[1]
 RDF_PATH = ROOT / "data" / "acm-ccs.ttl"
 
-RDF_FORMAT = "turtle"
-SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
-
-BATCH_SIZE = 500
+try:
+    # oxrdflib registers Rust-backed "ox-*" parsers with rdflib; much faster on large Turtle files.
+    import oxrdflib  # noqa: F401
 
+    RDF_FORMAT = "ox-turtle"
+except ImportError:
+    RDF_FORMAT = "turtle"
+SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+# prefLabel language preference: @en beats untagged (rank 1), which beats any other tag (rank 0).
+LANG_RANK = {"en": 2}
+
+BATCH_SIZE = 5000
+DEFAULT_CONCURRENCY = 8
+
+# Server-side parallel edge MERGEs via apoc.periodic.iterate (requires APOC).
+USE_APOC = os.getenv("NEO4J_IMPORT_USE_APOC", "false").strip().lower() in {"1", "true", "yes", "on"}
+APOC_BATCH_SIZE = 1000
+APOC_PARTITIONS = 32
+
+# Let Neo4j ingest the Turtle file itself via neosemantics (requires the n10s plugin).
+USE_N10S = os.getenv("NEO4J_IMPORT_USE_N10S", "false").strip().lower() in {"1", "true", "yes", "on"}
+
+APOC_ITERATE_CYPHER = """
+CALL apoc.periodic.iterate(
+    'UNWIND $pairs AS p RETURN p',
+    $action,
+    {batchSize: $batch_size, parallel: true, retries: 3, params: {pairs: $pairs}}
+)
+YIELD batches, failedBatches, errorMessages
+RETURN batches, failedBatches, errorMessages
+"""
+
+
+def _concurrency_from_env() -> int:
+    """Number of batches in flight at once; also sizes the driver connection pool."""
+    value = os.getenv("NEO4J_IMPORT_CONCURRENCY")
+    if value in (None, ""):
+        return DEFAULT_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise SystemExit(f"[ERROR] NEO4J_IMPORT_CONCURRENCY must be an integer, got {value!r}.") from None
+
+
+async def _write(tx, cypher, params):
+    result = await tx.run(cypher, params)
+    await result.consume()
+
+
+async def _run_batches(driver, cypher, rows, key, concurrency, batch=BATCH_SIZE):
+    # A session runs one transaction at a time, so each in-flight batch borrows its own.
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run_batch(chunk):
+        async with sem:
+            async with driver.session() as sess:
+                await sess.execute_write(_write, cypher, {key: chunk})
+
+    await asyncio.gather(*(run_batch(rows[i:i+batch]) for i in range(0, len(rows), batch)))
+
+
+async def _run_parallel_edges(session, action, pairs):
+    # MERGE locks both endpoints; children are mostly unique while parents are shared hubs,
+    # so keep each parent's edges together to stop concurrent batches contending for it.
+    ordered = sorted(pairs, key=lambda p: hash(p["parent"]) % APOC_PARTITIONS)
+    result = await session.run(APOC_ITERATE_CYPHER, {"action": action, "pairs": ordered, "batch_size": APOC_BATCH_SIZE})
+    # apoc.periodic.iterate reports failed batches in its result row instead of raising.
+    record = await result.single()
+    if record and record["failedBatches"]:
+        raise RuntimeError(
+            f"apoc.periodic.iterate failed {record['failedBatches']} of {record['batches']} batches: "
+            f"{record['errorMessages']}"
+        )
+
+
+async def _import_with_n10s(driver):
+    """
+    Bulk-load the Turtle file server-side. The file URL must be readable by the Neo4j server.
+    With handleVocabUris 'MAP' concepts become (:Resource {uri, prefLabel}) nodes linked by
+    :broader / :narrower, the shape queried by SkosGraphGateway.
+    """
+    async with driver.session() as sess:
+        result = await sess.run("CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS FOR (r:Resource) REQUIRE r.uri IS UNIQUE")
+        await result.consume()
+        try:
+            result = await sess.run("CALL n10s.graphconfig.init({handleVocabUris: 'MAP'})")
+            await result.consume()
+        except Exception as e:
+            print("[WARN] Could not init n10s graph config (already initialised?). Continuing.")
+            print("       Reason:", str(e))
 
-def neo4j_exec(driver, query, params=None):
-    with driver.session() as sess:
-        return sess.run(query, params or {}).consume()
+        result = await sess.run(
+            "CALL n10s.rdf.import.fetch($url, 'Turtle') YIELD terminationStatus, triplesLoaded, extraInfo "
+            "RETURN terminationStatus, triplesLoaded, extraInfo",
+            {"url": RDF_PATH.as_uri()},
+        )
+        record = await result.single()
+    if record:
+        print(f"[OK] n10s import {record['terminationStatus']}: {record['triplesLoaded']} triples {record['extraInfo'] or ''}")
 
 
-def main():
+async def main():
+    concurrency = _concurrency_from_env()
     if not RDF_PATH.exists():
         raise FileNotFoundError(f"RDF not found: {RDF_PATH}")
 
-    g = Graph()
-    g.parse(str(RDF_PATH), format=RDF_FORMAT)
-
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    driver = AsyncGraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD), max_connection_pool_size=concurrency)
 
     try:
-        try:
-            neo4j_exec(driver, "CREATE CONSTRAINT concept_uri IF NOT EXISTS FOR (c:Concept) REQUIRE c.uri IS UNIQUE")
-            print("[OK] Constraint :Concept(uri) unique")
-        except Exception as e:
-            print("[WARN] Could not create constraint (version/syntax). Continuing.")
-            print("       Reason:", str(e))
+        if USE_N10S:
+            await _import_with_n10s(driver)
+            return
+
+        g = Graph()
+        g.parse(str(RDF_PATH), format=RDF_FORMAT)
+
+        # Single pass over the store; rdflib terms are not interned, so compare by value.
+        pref_label = SKOS.prefLabel
+        broader = SKOS.broader
+        narrower = SKOS.narrower
 
         pref = {}
-        for s, _, o in g.triples((None, SKOS.prefLabel, None)):
-            if isinstance(s, URIRef) and isinstance(o, Literal):
-                # Prioriza inglês, mas pega qualquer se não tiver @en
-                lang = (o.language or "").lower()
-                val = str(o)
-                if s not in pref or (lang == "en" and pref[s][0] != "en"):
-                    pref[s] = (lang, val)
-
-        subjects = set()
-        for s, _, _ in g.triples((None, SKOS.prefLabel, None)):
-            if isinstance(s, URIRef):
-                subjects.add(str(s))
-        for s, _, o in g.triples((None, SKOS.broader, None)):
-            if isinstance(s, URIRef) and isinstance(o, URIRef):
-                subjects.add(str(s))
-                subjects.add(str(o))
-        for s, _, o in g.triples((None, SKOS.narrower, None)):
-            if isinstance(s, URIRef) and isinstance(o, URIRef):
-                subjects.add(str(s))
-                subjects.add(str(o))
-
-        subjects = list(subjects)
+        subjects = {}  # insertion-ordered set of concept URIs
+        # (child, parent) edges; skos:narrower is folded into its broader inverse so each
+        # relation is MERGEd once even when the file states both directions.
+        edges = {}
+        # SKOS fixes the term types for these predicates (concepts are URIRefs), so only the
+        # prefLabel object needs a cheap identity type check.
+        for s, p, o in g:
+            if p == pref_label:
+                key = str(s)
+                subjects[key] = None
+                if type(o) is Literal:
+                    # Prioriza inglês, mas pega qualquer se não tiver @en
+                    lang = o.language
+                    rank = LANG_RANK.get(lang.lower(), 0) if lang else 1
+                    current = pref.get(key)
+                    if current is None or rank > current[0]:
+                        pref[key] = (rank, str(o))
+            elif p == broader:
+                child, parent = str(s), str(o)
+                subjects[child] = None
+                subjects[parent] = None
+                edges[(child, parent)] = None
+            elif p == narrower:
+                parent, child = str(s), str(o)
+                subjects[parent] = None
+                subjects[child] = None
+                edges[(child, parent)] = None
+
         print(f"[INFO] Total concept URIs to MERGE: {len(subjects)}")
 
         merge_nodes_cypher = """
@@ -72,29 +172,10 @@ def main():
         SET c.prefLabel = coalesce(row.prefLabel, c.prefLabel)
         """
 
-        rows = []
-        for uri in subjects:
-            pl = None
-            if URIRef(uri) in pref:
-                pl = pref[URIRef(uri)][1]
-            rows.append({"uri": uri, "prefLabel": pl})
-
-        for i in range(0, len(rows), BATCH_SIZE):
-            batch = rows[i:i+BATCH_SIZE]
-            neo4j_exec(driver, merge_nodes_cypher, {"rows": batch})
-        print("[OK] Nodes merged")
-
-        broader_pairs = []
-        for s, _, o in g.triples((None, SKOS.broader, None)):
-            if isinstance(s, URIRef) and isinstance(o, URIRef):
-                broader_pairs.append({"child": str(s), "parent": str(o)})
-
-        narrower_pairs = []
-        for s, _, o in g.triples((None, SKOS.narrower, None)):
-            if isinstance(s, URIRef) and isinstance(o, URIRef):
-                narrower_pairs.append({"parent": str(s), "child": str(o)})
+        rows = [{"uri": uri, "prefLabel": pref.get(uri, (None, None))[1]} for uri in subjects]
 
-        print(f"[INFO] broader edges: {len(broader_pairs)} | narrower edges: {len(narrower_pairs)}")
+        broader_pairs = [{"child": child, "parent": parent} for child, parent in edges]
+        print(f"[INFO] broader/narrower edges (deduplicated): {len(broader_pairs)}")
 
         create_broader_cypher = """
         UNWIND $pairs AS p
@@ -103,26 +184,50 @@ def main():
         MERGE (child)-[:SKOS_BROADER]->(parent)
         """
 
+        # Materialize the inverse in-DB instead of shipping a second edge list over Bolt.
         create_narrower_cypher = """
-        UNWIND $pairs AS p
-        MATCH (parent:Concept {uri: p.parent})
-        MATCH (child:Concept {uri: p.child})
-        MERGE (parent)-[:SKOS_NARROWER]->(child)
+        MATCH (child:Concept)-[:SKOS_BROADER]->(parent:Concept)
+        CALL {
+            WITH child, parent
+            MERGE (parent)-[:SKOS_NARROWER]->(child)
+        } IN TRANSACTIONS OF 10000 ROWS
         """
 
-        for i in range(0, len(broader_pairs), BATCH_SIZE):
-            neo4j_exec(driver, create_broader_cypher, {"pairs": broader_pairs[i:i+BATCH_SIZE]})
+        apoc_broader_action = (
+            "MATCH (child:Concept {uri: p.child}) MATCH (parent:Concept {uri: p.parent}) "
+            "MERGE (child)-[:SKOS_BROADER]->(parent)"
+        )
+
+        async with driver.session() as sess:
+            try:
+                result = await sess.run("CREATE CONSTRAINT concept_uri IF NOT EXISTS FOR (c:Concept) REQUIRE c.uri IS UNIQUE")
+                await result.consume()
+                print("[OK] Constraint :Concept(uri) unique")
+            except Exception as e:
+                print("[WARN] Could not create constraint (version/syntax). Continuing.")
+                print("       Reason:", str(e))
+
+        await _run_batches(driver, merge_nodes_cypher, rows, "rows", concurrency)
+        print("[OK] Nodes merged")
+
+        if USE_APOC:
+            async with driver.session() as sess:
+                await _run_parallel_edges(sess, apoc_broader_action, broader_pairs)
+        else:
+            await _run_batches(driver, create_broader_cypher, broader_pairs, "pairs", concurrency)
         print("[OK] SKOS_BROADER edges created")
 
-        for i in range(0, len(narrower_pairs), BATCH_SIZE):
-            neo4j_exec(driver, create_narrower_cypher, {"pairs": narrower_pairs[i:i+BATCH_SIZE]})
+        # CALL { } IN TRANSACTIONS needs an auto-commit transaction.
+        async with driver.session() as sess:
+            result = await sess.run(create_narrower_cypher)
+            await result.consume()
         print("[OK] SKOS_NARROWER edges created")
 
         print("\n[DONE] Now your shortest-path step can run.")
 
     finally:
-        driver.close()
+        await driver.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -16,28 +16,30 @@ INPUT_RDF = ROOT / "data" / "acm-css.rdf"
 FIXED_RDF = ROOT / "data" / "acm-ccs-fixed.rdf"
 FIXED_TTL = ROOT / "data" / "acm-ccs.ttl"
 
+FIXED_ROOT = (
+    '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+    'xmlns:skos="http://www.w3.org/2004/02/skos/core#" '
+    'xmlns:skosxl="http://www.w3.org/2008/05/skos-xl#">'
+)
+# Matches a bare lang attribute; the lookbehind keeps the preceding whitespace (or line start).
+LANG_RE = re.compile(r'(?:(?<=\s)|^)lang="([^"]+)"')
+
 
 def preprocess_rdf_xml(src_path: Path, dst_path: Path) -> None:
     if not src_path.exists():
         raise FileNotFoundError(f"Input file not found: {src_path}")
 
-    lines = src_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    if not lines:
-        raise ValueError("Input RDF file is empty")
-
-    # Replace the first line with clean RDF root + namespaces (fix malformed xmlns)
-    lines[0] = (
-        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
-        'xmlns:skos="http://www.w3.org/2004/02/skos/core#" '
-        'xmlns:skosxl="http://www.w3.org/2008/05/skos-xl#">'
-    )
-
-    txt = "\n".join(lines)
+    with src_path.open("r", encoding="utf-8", errors="ignore") as fin:
+        # Replace the first line with clean RDF root + namespaces (fix malformed xmlns)
+        if next(fin, None) is None:
+            raise ValueError("Input RDF file is empty")
 
-    # RDF/XML expects xml:lang, not lang
-    txt = re.sub(r'\slang="([^"]+)"', r' xml:lang="\1"', txt)
+        with dst_path.open("w", encoding="utf-8") as fout:
+            fout.write(FIXED_ROOT + "\n")
+            for line in fin:
+                # RDF/XML expects xml:lang, not lang
+                fout.write(LANG_RE.sub(r'xml:lang="\1"', line))
 
-    dst_path.write_text(txt, encoding="utf-8")
     print(f"[OK] Wrote fixed RDF/XML: {dst_path}")
 
 
@@ -1,4 +1,5 @@
 import os
+import weakref
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -34,6 +35,11 @@ def _bool_env(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _close_resources(*resources) -> None:
+    for resource in resources:
+        resource.close()
+
+
 def create_app() -> Flask:
     load_dotenv()
 
@@ -45,6 +51,15 @@ def create_app() -> Flask:
     env_path_to_text_prompt = os.getenv("PATH_TO_TEXT_PROMPT_NAME", "prompts/path-to-text.txt")
     env_path_summary_prompt = os.getenv("PATH_SUMMARY_PROMPT_NAME", "prompts/path-summary.txt")
     env_candidate_decision_prompt = os.getenv("CANDIDATE_DECISION_PROMPT_NAME", "prompts/candidate-decision.txt")
+    prompt_repository.preload(
+        [
+            env_default_prompt,
+            env_default_system_prompt,
+            env_path_to_text_prompt,
+            env_path_summary_prompt,
+            env_candidate_decision_prompt,
+        ]
+    )
 
     ollama_config = OllamaClientConfig.from_env()
     ollama_client = OllamaClient(config=ollama_config)
@@ -55,7 +70,18 @@ def create_app() -> Flask:
     rdf_log_path = Path(rdf_log_path_env) if rdf_log_path_env else None
     analyze_log_path_env = os.getenv("ANALYZE_LOG_PATH")
     analyze_log_path = Path(analyze_log_path_env) if analyze_log_path_env else None
-    request_logger = RequestLogger(log_path=analyze_log_path) if analyze_log_path else None
+    request_logger = (
+        RequestLogger(
+            log_path=analyze_log_path,
+            flush_size=_int_env("ANALYZE_LOG_FLUSH_SIZE", 64),
+            flush_interval=_int_env("ANALYZE_LOG_FLUSH_INTERVAL_MS", 1000) / 1000,
+        )
+        if analyze_log_path
+        else None
+    )
+
+    # No point issuing more concurrent LLM calls than the Ollama server will decode in parallel.
+    llm_workers = ollama_config.num_parallel or 4
 
     service = KnowledgeGraphService(
         prompt_repository,
@@ -74,8 +100,15 @@ def create_app() -> Flask:
         enable_paths=_bool_env("ENABLE_PATHS", False),
         max_mentions=_int_env("MAX_MENTIONS", 8),
         candidate_decision_mode=os.getenv("CANDIDATE_DECISION_MODE", "first"),
+        candidate_search_workers=_int_env("CANDIDATE_SEARCH_WORKERS", 4),
+        candidate_cache_size=_int_env("CANDIDATE_CACHE_SIZE", 4096),
+        decision_workers=_int_env("DECISION_WORKERS", llm_workers),
+        path_translation_batch_size=_int_env("PATH_TRANSLATION_BATCH_SIZE", 8),
+        path_translation_workers=_int_env("PATH_TRANSLATION_WORKERS", llm_workers),
     )
     app.register_blueprint(create_analyze_blueprint(service))
+    # Release the RDF log handle, the Ollama session and the graph client when the app is collected or at exit.
+    weakref.finalize(app, _close_resources, service, ollama_client, graph_gateway)
 
     return app
 
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import csv
-import json
+import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import ContextVar, copy_context
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO, TypeVar
 from uuid import uuid4
 
+import orjson
+
 from ..domain.models import (
     AnalyzeRequest,
     AnalyzeResponse,
@@ -19,12 +26,58 @@ from ..domain.models import (
     PathEvidence,
     PathStep,
 )
+from ..infrastructure.cache import LRUCache
 from ..infrastructure.ollama_client import OllamaClient
 from ..infrastructure.prompt_repository import PromptRepository
 from ..infrastructure.rdf_builder import RDFBuilder
 from ..infrastructure.request_logger import RequestLogger
 from ..infrastructure.wikidata_client import WikidataGateway
 
+_UTC = timezone.utc
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _dumps(value: object) -> str:
+    """Serialize ``value`` to compact UTF-8 JSON text for prompt templates."""
+    return orjson.dumps(value).decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _step_json(step: PathStep) -> bytes:
+    # Steps are frozen and recur across paths and requests (shared hubs), so each is encoded once.
+    return orjson.dumps(step)
+
+
+def _paths_json(paths: list[list[PathStep]]) -> str:
+    """Encode ``paths`` as a JSON array of step arrays from the per-step cache."""
+    return (b"[" + b",".join(b"[" + b",".join(map(_step_json, path)) + b"]" for path in paths) + b"]").decode("utf-8")
+
+
+_PLACEHOLDER = re.compile(r"\$\{(\w+)\}")
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a ``${NAME}`` prompt template into its literal segments and placeholder names."""
+    parts = _PLACEHOLDER.split(template)
+    return tuple(parts[::2]), tuple(parts[1::2])
+
+
+def _fill_template(template: str, **values: str) -> str:
+    """Fill every ``${NAME}`` placeholder in one pass; unknown placeholders are left intact."""
+    literals, keys = _compile_template(template)
+    out = [""] * (len(literals) + len(keys))
+    out[::2] = literals
+    out[1::2] = [values[key] if key in values else f"${{{key}}}" for key in keys]
+    return "".join(out)
+
+
+# Per-request buffer of (timestamp, event, payload) tuples; None outside analyze().
+_EVENT_BUFFER: ContextVar[list[tuple[datetime, str, dict]] | None] = ContextVar("_EVENT_BUFFER", default=None)
+
 
 class KnowledgeGraphService:
     """
@@ -35,6 +88,11 @@ class KnowledgeGraphService:
     4) RDF graph materialization (Turtle + JSON-LD)
     """
 
+    # Paths with at most this many distinct steps are verbalized without the LLM.
+    _DETERMINISTIC_STEP_LIMIT = 3
+
+    _RDF_LOG_FIELDS = ("start_time", "end_time", "input_text", "rdf_turtle", "model", "rdf_valid")
+
     _STOPWORDS = {
         "a",
         "an",
@@ -96,6 +154,11 @@ class KnowledgeGraphService:
         enable_paths: bool = False,
         max_mentions: int = 8,
         candidate_decision_mode: str = "first",
+        candidate_search_workers: int = 4,
+        candidate_cache_size: int = 4096,
+        decision_workers: int = 4,
+        path_translation_batch_size: int = 8,
+        path_translation_workers: int = 4,
     ) -> None:
         self.prompt_repository = prompt_repository
         self.default_prompt = default_prompt
@@ -113,68 +176,104 @@ class KnowledgeGraphService:
         self.enable_paths = enable_paths
         self.max_mentions = max(1, int(max_mentions))
         self.candidate_decision_mode = candidate_decision_mode
+        self.candidate_search_workers = max(1, int(candidate_search_workers))
+        # Keyed by (casefolded surface, top_k); shared across requests.
+        self._candidate_cache: LRUCache[tuple[str, int], list[Candidate]] = LRUCache(candidate_cache_size)
+        self.decision_workers = max(1, int(decision_workers))
+        self.path_translation_batch_size = max(1, int(path_translation_batch_size))
+        self.path_translation_workers = max(1, int(path_translation_workers))
+        # Lazily opened append handle for the RDF CSV log, shared across requests.
+        self._rdf_log_fp: TextIO | None = None
+        self._rdf_log_writer = None
+        self._rdf_log_lock = threading.Lock()
 
     def analyze(self, request: AnalyzeRequest) -> AnalyzeResponse:
-        start_time = datetime.now(timezone.utc)
+        start_time = datetime.now(_UTC)
         idempotence_key = request.idempotence_key or str(uuid4())
         if not self.ollama_client:
             raise RuntimeError("LLM client is not configured.")
         if not self.graph_gateway:
             raise RuntimeError("Entity gateway is not configured. Configure Wikidata access.")
 
-        system_prompt_name = request.system_prompt_name or self.default_system_prompt
-        system_prompt_text = self.prompt_repository.load_prompt(system_prompt_name)
-
-        ner_prompt_name = request.prompt_name or self.default_prompt
-        ner_prompt_text = self.prompt_repository.load_prompt(ner_prompt_name)
-        mentions, ner_generation = self._extract_mentions(
-            text=request.text,
-            prompt_name=ner_prompt_name,
-            prompt_text=ner_prompt_text,
-            system_prompt_text=system_prompt_text,
-            idempotence_key=idempotence_key,
-        )
+        # Events are collected for the whole request and written in one batch at the end.
+        events: list[tuple[datetime, str, dict]] = []
+        token = _EVENT_BUFFER.set(events)
+        try:
+            system_prompt_name = request.system_prompt_name or self.default_system_prompt
+            system_prompt_text = self.prompt_repository.load_prompt(system_prompt_name)
+
+            ner_prompt_name = request.prompt_name or self.default_prompt
+            ner_prompt_text = self.prompt_repository.load_prompt(ner_prompt_name)
+            mentions, ner_generation = self._extract_mentions(
+                text=request.text,
+                prompt_name=ner_prompt_name,
+                prompt_text=ner_prompt_text,
+                system_prompt_text=system_prompt_text,
+                idempotence_key=idempotence_key,
+            )
 
-        candidate_selections = self._select_candidates(mentions, top_k=request.top_k, idempotence_key=idempotence_key)
-        paths = self._compute_paths(
-            candidate_selections,
-            max_hops=request.max_hops,
-            hub_threshold=request.hub_threshold,
-            idempotence_key=idempotence_key,
-        )
+            candidate_selections = self._select_candidates(mentions, top_k=request.top_k, idempotence_key=idempotence_key)
+            paths = self._compute_paths(
+                candidate_selections,
+                max_hops=request.max_hops,
+                hub_threshold=request.hub_threshold,
+                idempotence_key=idempotence_key,
+            )
 
-        path_sentences, path_generation = self._paths_to_text(paths, system_prompt_text, idempotence_key=idempotence_key)
-        summary_text, summary_generation = self._summarize_paths(path_sentences, system_prompt_text, idempotence_key=idempotence_key)
-        disambiguation, decision_generations = self._decide_candidates(
-            text=request.text,
-            mentions=mentions,
-            candidate_selections=candidate_selections,
-            summary_text=summary_text,
-            paths=paths,
-            system_prompt_text=system_prompt_text,
-            idempotence_key=idempotence_key,
-        )
+            unique_steps = self._unique_steps(paths)
+            readable = bool(getattr(self.graph_gateway, "readable_predicates", False))
+            if paths and readable and len(unique_steps) <= self._DETERMINISTIC_STEP_LIMIT:
+                # A handful of readable relations works as plain sentences; skip both LLM round-trips.
+                path_sentences = [self._step_sentence(step) for step in unique_steps]
+                path_generation: list[dict] | None = None
+                summary_text, summary_generation = " ".join(path_sentences), None
+            else:
+                path_sentences, path_generation = self._paths_to_text(paths, system_prompt_text, idempotence_key=idempotence_key)
+                summary_text, summary_generation = self._summarize_paths(
+                    path_sentences, system_prompt_text, idempotence_key=idempotence_key
+                )
+            disambiguation, decision_generations = self._decide_candidates(
+                text=request.text,
+                mentions=mentions,
+                candidate_selections=candidate_selections,
+                summary_text=summary_text,
+                paths=paths,
+                system_prompt_text=system_prompt_text,
+                idempotence_key=idempotence_key,
+            )
 
-        rdf = self.rdf_builder.build(text=request.text, disambiguated_mentions=disambiguation)
-
-        generation_payload = {
-            "ner": ner_generation,
-            "path_translation": path_generation,
-            "path_summary": summary_generation,
-            "decisions": decision_generations,
-        }
-
-        end_time = datetime.now(timezone.utc)
-        self._log_final_rdf(start_time, end_time, request.text, rdf)
-
-        return AnalyzeResponse(
-            text=request.text,
-            mentions=mentions,
-            candidate_selections=candidate_selections,
-            disambiguation=disambiguation,
-            rdf=rdf,
-            generation=generation_payload,
-        )
+            rdf = self.rdf_builder.build(
+                text=request.text,
+                disambiguated_mentions=disambiguation,
+                document_id=request.idempotence_key,
+            )
+
+            generation_payload = {
+                "ner": ner_generation,
+                "path_translation": path_generation,
+                "path_summary": summary_generation,
+                "decisions": decision_generations,
+            }
+
+            end_time = datetime.now(_UTC)
+            self._log_final_rdf(start_time, end_time, request.text, rdf)
+
+            return AnalyzeResponse(
+                text=request.text,
+                mentions=mentions,
+                candidate_selections=candidate_selections,
+                disambiguation=disambiguation,
+                rdf=rdf,
+                generation=generation_payload,
+            )
+        finally:
+            _EVENT_BUFFER.reset(token)
+            if self.request_logger and events:
+                try:
+                    self.request_logger.log_batch(idempotence_key, events)
+                except OSError:
+                    # The request log is diagnostic; it must not replace the result or the pipeline's own error.
+                    _logger.exception("Failed to write request events for %s", idempotence_key)
 
     def health(self) -> dict:
         wikidata_status = self.graph_gateway.health() if self.graph_gateway else {"status": "unconfigured"}
@@ -189,7 +288,7 @@ class KnowledgeGraphService:
         system_prompt_text: str,
         idempotence_key: str,
     ) -> tuple[MentionExtraction, dict]:
-        message = prompt_text.replace("${USER_TEXT}", text)
+        message = _fill_template(prompt_text, USER_TEXT=text)
         self._log_event(idempotence_key, "ollama_request", {"stage": "ner", "prompt_name": prompt_name, "input_text": text})
         generation = self.ollama_client.generate(
             system_prompt=system_prompt_text,
@@ -205,8 +304,8 @@ class KnowledgeGraphService:
 
         payload = generation.get("response") or "{}"
         try:
-            data = json.loads(payload)
-        except json.JSONDecodeError:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
             data = {"mentions": self._mentions_from_truncated_json(payload)}
 
         mentions: list[Mention] = []
@@ -227,8 +326,8 @@ class KnowledgeGraphService:
         mentions: list[dict] = []
         for match in re.finditer(r'\{\s*"surface"\s*:\s*"([^"]+)"[^{}]*\}', payload):
             try:
-                item = json.loads(match.group(0))
-            except json.JSONDecodeError:
+                item = orjson.loads(match.group(0))
+            except orjson.JSONDecodeError:
                 continue
             mentions.append(item)
             if len(mentions) >= self.max_mentions:
@@ -282,21 +381,69 @@ class KnowledgeGraphService:
         return mentions
 
     def _select_candidates(self, mentions: MentionExtraction, top_k: int, idempotence_key: str) -> list[MentionCandidates]:
-        selections: list[MentionCandidates] = []
+        # Repeated surfaces (same entity mentioned twice) are looked up once, keyed like the cache.
+        surfaces: dict[str, str] = {}
         for mention in mentions.mentions:
+            surfaces.setdefault(mention.surface.casefold(), mention.surface)
+
+        found: dict[str, list[Candidate]] = {}
+        misses: list[str] = []
+        for key, surface in surfaces.items():
+            cached = self._candidate_cache.get((key, top_k))
+            if cached is not None:
+                found[key] = cached
+            else:
+                misses.append(surface)
+
+        def log_request(surface: str) -> None:
             self._log_event(
                 idempotence_key,
                 "wikidata_request",
-                {"stage": "candidate_selection", "surface": mention.surface, "top_k": top_k},
+                {"stage": "candidate_selection", "surface": surface, "top_k": top_k},
             )
-            candidates = self.graph_gateway.search_candidates(surface=mention.surface, limit=top_k)
+
+        def record(surface: str, candidates: list[Candidate]) -> list[Candidate]:
             self._log_event(
                 idempotence_key,
                 "wikidata_response",
-                {"stage": "candidate_selection", "surface": mention.surface, "candidates": [c.to_dict() for c in candidates]},
+                {"stage": "candidate_selection", "surface": surface, "candidates": [c.to_dict() for c in candidates]},
             )
-            selections.append(MentionCandidates(surface=mention.surface, candidates=candidates))
-        return selections
+            # Empty results may come from a failed lookup; don't pin them.
+            if candidates:
+                self._candidate_cache.set((surface.casefold(), top_k), candidates)
+            return candidates
+
+        def search(surface: str) -> list[Candidate]:
+            log_request(surface)
+            return record(surface, self.graph_gateway.search_candidates(surface=surface, limit=top_k))
+
+        search_batch = getattr(self.graph_gateway, "search_candidates_batch", None)
+        if misses and search_batch is not None:
+            # One round-trip for every uncached surface.
+            for surface in misses:
+                log_request(surface)
+            batch = search_batch(misses, limit=top_k)
+            for surface in misses:
+                found[surface.casefold()] = record(surface, batch.get(surface, []))
+        else:
+            # Lookups are independent network calls, so overlap them instead of paying each RTT in turn.
+            results = self._map_concurrently(search, misses, self.candidate_search_workers)
+            for surface, candidates in zip(misses, results):
+                found[surface.casefold()] = candidates
+
+        return [
+            MentionCandidates(surface=mention.surface, candidates=list(found[mention.surface.casefold()]))
+            for mention in mentions.mentions
+        ]
+
+    def _map_concurrently(self, func: Callable[[T], R], items: list[T], max_workers: int) -> list[R]:
+        """Apply ``func`` to every item on a thread pool, returning results in input order."""
+        if max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        # Each task runs in a copy of the caller's context so request-scoped state (the event buffer) carries over.
+        contexts = [copy_context() for _ in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda ctx, item: ctx.run(func, item), contexts, items))
 
     def _compute_paths(
         self,
@@ -307,116 +454,148 @@ class KnowledgeGraphService:
     ) -> list[list[PathStep]]:
         if not self.enable_paths:
             return []
+        # A path needs two endpoints; with fewer than two candidates overall there is nothing to connect.
+        if sum(len(selection.candidates[: self.path_candidate_limit]) for selection in candidate_selections) < 2:
+            return []
+
+        # Collect every (source, target) pair first so the gateway can resolve them in bulk.
+        # Gateways whose path search ignores edge direction only need one orientation per pair.
+        # The same IRI can show up under several mentions, so pairs are deduplicated and
+        # self-pairs dropped; keys are unordered for symmetric gateways.
+        symmetric = bool(getattr(self.graph_gateway, "symmetric_paths", False))
+        pairs: dict[frozenset[str] | tuple[str, str], tuple[str, str]] = {}
+
+        def add_pair(source_iri: str, target_iri: str) -> None:
+            if source_iri == target_iri:
+                return
+            key = frozenset((source_iri, target_iri)) if symmetric else (source_iri, target_iri)
+            pairs.setdefault(key, (source_iri, target_iri))
 
-        paths: list[list[PathStep]] = []
         for idx, selection in enumerate(candidate_selections):
-            for candidate in selection.candidates[: self.path_candidate_limit]:
+            candidates = selection.candidates[: self.path_candidate_limit]
+            for i, candidate in enumerate(candidates):
                 # Paths to candidates in other mentions
                 for other_idx, other in enumerate(candidate_selections):
-                    if idx == other_idx:
+                    if idx == other_idx or (symmetric and other_idx < idx):
                         continue
                     for other_candidate in other.candidates[: self.path_candidate_limit]:
-                        self._log_event(
-                            idempotence_key,
-                            "wikidata_request",
-                            {
-                                "stage": "shortest_path",
-                                "source": candidate.iri,
-                                "target": other_candidate.iri,
-                                "max_hops": max_hops,
-                                "hub_threshold": hub_threshold,
-                            },
-                        )
-                        path = self.graph_gateway.shortest_path(
-                            candidate.iri,
-                            other_candidate.iri,
-                            max_hops=max_hops,
-                            hub_threshold=hub_threshold,
-                        )
-                        if path:
-                            self._log_event(
-                                idempotence_key,
-                                "wikidata_response",
-                                {
-                                    "stage": "shortest_path",
-                                    "source": candidate.iri,
-                                    "target": other_candidate.iri,
-                                    "path_length": len(path),
-                                },
-                            )
-                            paths.append(path)
+                        add_pair(candidate.iri, other_candidate.iri)
 
                 if not self.path_within_mentions:
                     continue
 
                 # Optional intra-mention disambiguation (pairwise within same mention)
-                for other_candidate in selection.candidates[: self.path_candidate_limit]:
-                    if other_candidate.iri == candidate.iri:
-                        continue
-                    self._log_event(
-                        idempotence_key,
-                        "wikidata_request",
-                        {
-                            "stage": "shortest_path",
-                            "source": candidate.iri,
-                            "target": other_candidate.iri,
-                            "max_hops": max_hops,
-                            "hub_threshold": hub_threshold,
-                        },
-                    )
-                    path = self.graph_gateway.shortest_path(
-                        candidate.iri,
-                        other_candidate.iri,
-                        max_hops=max_hops,
-                        hub_threshold=hub_threshold,
-                    )
-                    if path:
-                        self._log_event(
-                            idempotence_key,
-                            "wikidata_response",
-                            {
-                                "stage": "shortest_path",
-                                "source": candidate.iri,
-                                "target": other_candidate.iri,
-                                "path_length": len(path),
-                            },
-                        )
-                        paths.append(path)
+                for other_candidate in candidates[i + 1 :] if symmetric else candidates:
+                    add_pair(candidate.iri, other_candidate.iri)
+
+        unique_pairs = list(pairs.values())
+        for source_iri, target_iri in unique_pairs:
+            self._log_event(
+                idempotence_key,
+                "wikidata_request",
+                {
+                    "stage": "shortest_path",
+                    "source": source_iri,
+                    "target": target_iri,
+                    "max_hops": max_hops,
+                    "hub_threshold": hub_threshold,
+                },
+            )
+        results = self._shortest_paths(unique_pairs, max_hops=max_hops, hub_threshold=hub_threshold)
+
+        paths: list[list[PathStep]] = []
+        for (source_iri, target_iri), path in zip(unique_pairs, results):
+            if path:
+                self._log_event(
+                    idempotence_key,
+                    "wikidata_response",
+                    {
+                        "stage": "shortest_path",
+                        "source": source_iri,
+                        "target": target_iri,
+                        "path_length": len(path),
+                    },
+                )
+                paths.append(path)
         return paths
 
-    def _paths_to_text(self, paths: list[list[PathStep]], system_prompt_text: str, idempotence_key: str) -> tuple[list[str], dict | None]:
+    def _shortest_paths(
+        self,
+        pairs: list[tuple[str, str]],
+        max_hops: int,
+        hub_threshold: int | None,
+    ) -> list[list[PathStep] | None]:
+        # Prefer the gateway's bulk lookup; fall back to one call per pair for simpler gateways.
+        # Gateways that offer batch() get to reuse one connection/session for all of it.
+        batch = getattr(self.graph_gateway, "batch", None)
+        shortest_paths = getattr(self.graph_gateway, "shortest_paths", None)
+        with batch() if batch is not None else nullcontext():
+            if shortest_paths is not None:
+                return shortest_paths(pairs, max_hops=max_hops, hub_threshold=hub_threshold)
+            return [
+                self.graph_gateway.shortest_path(source_iri, target_iri, max_hops=max_hops, hub_threshold=hub_threshold)
+                for source_iri, target_iri in pairs
+            ]
+
+    def _paths_to_text(
+        self, paths: list[list[PathStep]], system_prompt_text: str, idempotence_key: str
+    ) -> tuple[list[str], list[dict] | None]:
         if not paths:
             return [], None
 
+        # Translate paths in fixed-size batches so the LLM calls can overlap.
         prompt_text = self.prompt_repository.load_prompt(self.path_to_text_prompt)
-        payload = json.dumps([[step.to_dict() for step in path] for path in paths], ensure_ascii=False)
-        message = prompt_text.replace("${PATHS_JSON}", payload)
-        self._log_event(idempotence_key, "ollama_request", {"stage": "path_to_text", "prompt_name": self.path_to_text_prompt})
-        generation = self.ollama_client.generate(
-            system_prompt=system_prompt_text,
-            prompt=message,
-            prompt_name=self.path_to_text_prompt,
-        )
-        self._log_event(
-            idempotence_key,
-            "ollama_response",
-            {"stage": "path_to_text", "prompt_name": self.path_to_text_prompt, "response": generation},
-        )
-        response_text = generation.get("response") or "[]"
-        try:
-            path_sentences = json.loads(response_text)
-            if not isinstance(path_sentences, list):
-                raise ValueError("Path translation output must be a list of strings.")
-        except (json.JSONDecodeError, ValueError) as exc:
-            raise ValueError("Path translation stage returned invalid JSON.") from exc
+        size = self.path_translation_batch_size
+        batches = [paths[i : i + size] for i in range(0, len(paths), size)]
+
+        def translate(batch: list[list[PathStep]]) -> dict:
+            message = _fill_template(prompt_text, PATHS_JSON=_paths_json(batch))
+            self._log_event(
+                idempotence_key,
+                "ollama_request",
+                {"stage": "path_to_text", "prompt_name": self.path_to_text_prompt, "path_count": len(batch)},
+            )
+            generation = self.ollama_client.generate(
+                system_prompt=system_prompt_text,
+                prompt=message,
+                prompt_name=self.path_to_text_prompt,
+            )
+            self._log_event(
+                idempotence_key,
+                "ollama_response",
+                {"stage": "path_to_text", "prompt_name": self.path_to_text_prompt, "response": generation},
+            )
+            return generation
+
+        generations = self._map_concurrently(translate, batches, self.path_translation_workers)
+        path_sentences: list[str] = []
+        for generation in generations:
+            response_text = generation.get("response") or "[]"
+            try:
+                sentences = orjson.loads(response_text)
+                if not isinstance(sentences, list):
+                    raise ValueError("Path translation output must be a list of strings.")
+            except (orjson.JSONDecodeError, ValueError) as exc:
+                raise ValueError("Path translation stage returned invalid JSON.") from exc
+            path_sentences.extend(sentences)
+
+        return path_sentences, generations
+
+    def _unique_steps(self, paths: list[list[PathStep]]) -> list[PathStep]:
+        unique: dict[tuple[str, str, str], PathStep] = {}
+        for path in paths:
+            for step in path:
+                unique.setdefault((step.subject_iri, step.predicate, step.object_iri), step)
+        return list(unique.values())
 
-        return path_sentences, generation
+    def _step_sentence(self, step: PathStep) -> str:
+        return f"{step.subject_label or step.subject_iri} {step.predicate} {step.object_label or step.object_iri}."
 
     def _summarize_paths(self, path_sentences: list[str], system_prompt_text: str, idempotence_key: str) -> tuple[str, dict | None]:
         if not path_sentences:
             return "", None
         prompt_text = self.prompt_repository.load_prompt(self.path_summary_prompt)
-        message = prompt_text.replace("${PATH_SENTENCES_JSON}", json.dumps(path_sentences, ensure_ascii=False))
+        message = _fill_template(prompt_text, PATH_SENTENCES_JSON=_dumps(path_sentences))
         self._log_event(idempotence_key, "ollama_request", {"stage": "path_summary", "prompt_name": self.path_summary_prompt})
         generation = self.ollama_client.generate(
             system_prompt=system_prompt_text,
@@ -443,10 +622,11 @@ class KnowledgeGraphService:
     ) -> tuple[list[DisambiguatedMention], list[dict]]:
         decisions: list[DisambiguatedMention] = []
         decision_generations: list[dict] = []
-        prompt_template = self.prompt_repository.load_prompt(self.candidate_decision_prompt)
+        evidence = PathEvidence(paths=paths, summary=summary_text or None)
+        pairs = list(zip(mentions.mentions, candidate_selections))
 
-        for mention, selection in zip(mentions.mentions, candidate_selections):
-            if self.candidate_decision_mode == "first":
+        if self.candidate_decision_mode == "first":
+            for mention, selection in pairs:
                 decisions.append(
                     DisambiguatedMention(
                         surface=mention.surface,
@@ -455,24 +635,36 @@ class KnowledgeGraphService:
                         end=mention.end,
                         confidence=mention.confidence,
                         chosen=selection.candidates[0] if selection.candidates else None,
-                        evidence=PathEvidence(paths=paths, summary=summary_text or None),
+                        evidence=evidence,
                     )
                 )
-                continue
+            return decisions, decision_generations
 
+        # Build every prompt up front, then overlap the LLM round-trips.
+        # The template is split into literals/placeholders once and reused for every mention.
+        prompt_template = self.prompt_repository.load_prompt(self.candidate_decision_prompt)
+        messages: list[str] = []
+        for mention, selection in pairs:
             context = self._extract_context(text, mention.start, mention.end)
-            candidate_payload = [c.to_dict() for c in selection.candidates]
-            message = (
-                prompt_template.replace("${SURFACE}", mention.surface)
-                .replace("${CONTEXT}", context)
-                .replace("${SUMMARY}", summary_text or "")
-                .replace("${CANDIDATES_JSON}", json.dumps(candidate_payload, ensure_ascii=False))
+            messages.append(
+                _fill_template(
+                    prompt_template,
+                    SURFACE=mention.surface,
+                    CONTEXT=context,
+                    SUMMARY=summary_text or "",
+                    CANDIDATES_JSON=_dumps(selection.candidates),
+                )
             )
-            generation = self.ollama_client.generate(
+
+        def decide(message: str) -> dict:
+            return self.ollama_client.generate(
                 system_prompt=system_prompt_text,
                 prompt=message,
                 prompt_name=self.candidate_decision_prompt,
             )
+
+        generations = self._map_concurrently(decide, messages, self.decision_workers)
+        for (mention, selection), generation in zip(pairs, generations):
             decision_generations.append(generation)
             self._log_event(
                 idempotence_key,
@@ -489,7 +681,7 @@ class KnowledgeGraphService:
                     end=mention.end,
                     confidence=mention.confidence,
                     chosen=chosen_candidate,
-                    evidence=PathEvidence(paths=paths, summary=summary_text or None),
+                    evidence=evidence,
                 )
             )
         return decisions, decision_generations
@@ -498,13 +690,13 @@ class KnowledgeGraphService:
         if not response_text:
             return selection.candidates[0] if selection.candidates else None
         try:
-            data = json.loads(response_text)
+            data = orjson.loads(response_text)
             iri = data.get("iri")
             label = data.get("label")
             if not iri and selection.candidates:
                 return selection.candidates[0]
             return Candidate(iri=iri, label=label or "", score=data.get("score"))
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return selection.candidates[0] if selection.candidates else None
 
     def _extract_context(self, text: str, start: int | None, end: int | None, window: int = 80) -> str:
@@ -517,29 +709,38 @@ class KnowledgeGraphService:
     def _log_final_rdf(self, start_time: datetime, end_time: datetime, input_text: str, rdf: RDFGraphResult) -> None:
         if not self.rdf_log_path:
             return
-        self.rdf_log_path.parent.mkdir(parents=True, exist_ok=True)
-        write_header = not self.rdf_log_path.exists()
-        with self.rdf_log_path.open("a", encoding="utf-8", newline="") as fp:
-            writer = csv.DictWriter(fp, fieldnames=["start_time", "end_time", "input_text", "rdf_turtle", "model", "rdf_valid"])
-            if write_header:
-                writer.writeheader()
-            # Heuristic: consider RDF valid if Turtle has at least one triple terminator "."
-            rdf_valid = bool(rdf.turtle and "." in rdf.turtle)
-            model_name = None
-            if self.ollama_client:
-                client_config = getattr(self.ollama_client, "config", None)
-                model_name = getattr(client_config, "model", None)
-            writer.writerow(
-                {
-                    "start_time": start_time.isoformat(),
-                    "end_time": end_time.isoformat(),
-                    "input_text": input_text,
-                    "rdf_turtle": rdf.turtle,
-                    "model": model_name,
-                    "rdf_valid": rdf_valid,
-                }
-            )
+        # Heuristic: consider RDF valid if Turtle has at least one triple terminator "."
+        rdf_valid = bool(rdf.turtle and "." in rdf.turtle)
+        model_name = None
+        if self.ollama_client:
+            client_config = getattr(self.ollama_client, "config", None)
+            model_name = getattr(client_config, "model", None)
+        row = [start_time.isoformat(), end_time.isoformat(), input_text, rdf.turtle, model_name, rdf_valid]
+        with self._rdf_log_lock:
+            if self._rdf_log_writer is None:
+                self.rdf_log_path.parent.mkdir(parents=True, exist_ok=True)
+                write_header = not self.rdf_log_path.exists()
+                self._rdf_log_fp = self.rdf_log_path.open("a", encoding="utf-8", newline="")
+                self._rdf_log_writer = csv.writer(self._rdf_log_fp)
+                if write_header:
+                    self._rdf_log_writer.writerow(self._RDF_LOG_FIELDS)
+            self._rdf_log_writer.writerow(row)
+            self._rdf_log_fp.flush()
+
+    def close(self) -> None:
+        """Close the RDF CSV log handle, if one was opened."""
+        with self._rdf_log_lock:
+            if self._rdf_log_fp is not None:
+                self._rdf_log_fp.close()
+            self._rdf_log_fp = None
+            self._rdf_log_writer = None
 
     def _log_event(self, idempotence_key: str, event: str, payload: dict) -> None:
-        if self.request_logger:
+        if not self.request_logger:
+            return
+        events = _EVENT_BUFFER.get()
+        if events is None:
             self.request_logger.log(idempotence_key=idempotence_key, event=event, payload=payload)
+            return
+        # orjson formats the datetime when the batch is written, off the pipeline's critical path.
+        events.append((datetime.now(_UTC), event, payload))
@@ -1,5 +1,6 @@
-from flask import Blueprint, jsonify, request
+import orjson
 import requests
+from flask import Blueprint, Response, jsonify, request
 
 from ..application.services import KnowledgeGraphService
 from ..domain.models import AnalyzeRequest
@@ -15,7 +16,7 @@ def create_analyze_blueprint(service: KnowledgeGraphService) -> Blueprint:
         return jsonify(status), http_status
 
     @blueprint.route("/analyze", methods=["POST"])
-    def analyze() -> tuple:
+    def analyze() -> tuple | Response:
         data = request.get_json(silent=True) or {}
         text = data.get("text")
         if not text:
@@ -61,6 +62,7 @@ def create_analyze_blueprint(service: KnowledgeGraphService) -> Blueprint:
         except ValueError as exc:
             return jsonify({"error": str(exc)}), 400
 
-        return jsonify({"text": response.text, "rdf": response.rdf.turtle}), 200
+        body = orjson.dumps({"text": response.text, "rdf": response.rdf.turtle}, option=orjson.OPT_APPEND_NEWLINE)
+        return Response(body, status=200, mimetype="application/json")
 
     return blueprint
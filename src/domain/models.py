@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeRequest:
     text: str
     prompt_name: str | None = None
@@ -15,7 +15,7 @@ class AnalyzeRequest:
     idempotence_key: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mention:
     surface: str
     label: str | None
@@ -33,15 +33,20 @@ class Mention:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MentionExtraction:
     mentions: list[Mention] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        return {"mentions": [mention.to_dict() for mention in self.mentions]}
+        return {
+            "mentions": [
+                {"surface": m.surface, "label": m.label, "start": m.start, "end": m.end, "confidence": m.confidence}
+                for m in self.mentions
+            ]
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Candidate:
     iri: str
     label: str
@@ -51,16 +56,19 @@ class Candidate:
         return {"iri": self.iri, "label": self.label, "score": self.score}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MentionCandidates:
     surface: str
     candidates: list[Candidate] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        return {"surface": self.surface, "candidates": [c.to_dict() for c in self.candidates]}
+        return {
+            "surface": self.surface,
+            "candidates": [{"iri": c.iri, "label": c.label, "score": c.score} for c in self.candidates],
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathStep:
     subject_iri: str
     subject_label: str | None
@@ -69,28 +77,33 @@ class PathStep:
     object_label: str | None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "subject_iri": self.subject_iri,
-            "subject_label": self.subject_label,
-            "predicate": self.predicate,
-            "object_iri": self.object_iri,
-            "object_label": self.object_label,
-        }
+        return _step_to_dict(self)
+
+
+def _step_to_dict(step: PathStep) -> dict[str, Any]:
+    # Module-level so PathEvidence can serialize large path lists without a method lookup per step.
+    return {
+        "subject_iri": step.subject_iri,
+        "subject_label": step.subject_label,
+        "predicate": step.predicate,
+        "object_iri": step.object_iri,
+        "object_label": step.object_label,
+    }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathEvidence:
     paths: list[list[PathStep]] = field(default_factory=list)
     summary: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "paths": [[step.to_dict() for step in path] for path in self.paths],
+            "paths": [[_step_to_dict(step) for step in path] for path in self.paths],
             "summary": self.summary,
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DisambiguatedMention:
     surface: str
     chosen: Candidate | None
@@ -112,17 +125,17 @@ class DisambiguatedMention:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RDFGraphResult:
     document_uri: str
     turtle: str
-    jsonld: str
+    jsonld: dict[str, Any]
 
     def to_dict(self) -> dict[str, Any]:
         return {"document_uri": self.document_uri, "turtle": self.turtle, "jsonld": self.jsonld}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeResponse:
     text: str
     mentions: MentionExtraction
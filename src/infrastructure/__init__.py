@@ -1,3 +1,4 @@
+from .cache import LRUCache
 from .wikidata_client import WikidataConfig, WikidataGateway
 from .ollama_client import OllamaClient, OllamaClientConfig, OllamaOptions
 from .prompt_repository import PromptRepository
@@ -5,6 +6,7 @@ from .rdf_builder import RDFBuilder
 from .request_logger import RequestLogger
 
 __all__ = [
+    "LRUCache",
     "WikidataConfig",
     "WikidataGateway",
     "OllamaClient",
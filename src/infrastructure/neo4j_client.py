@@ -3,17 +3,24 @@ from __future__ import annotations
 import asyncio
 import inspect
 import os
+import threading
+from array import array
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-from neo4j import Driver, GraphDatabase
+from neo4j import Driver, GraphDatabase, Session
 
 # Neo4j <6 uses asyncio.iscoroutinefunction, which is deprecated in Python 3.14+.
 # Patch it to the recommended inspect.iscoroutinefunction to avoid runtime warnings.
 asyncio.iscoroutinefunction = inspect.iscoroutinefunction
 
 from ..domain.models import Candidate, PathStep
+from .cache import LRUCache
+
+# Distinguishes "not cached" from a cached "no path" (None).
+_MISSING = object()
 
 
 @dataclass(frozen=True)
@@ -23,6 +30,8 @@ class Neo4jConfig:
     password: str | None
     database: str | None
     fulltext_index: str = "skos_fulltext"
+    path_cache_size: int = 100_000
+    path_cache_ttl: float = 3600.0
 
     @classmethod
     def from_env(cls) -> "Neo4jConfig":
@@ -32,6 +41,66 @@ class Neo4jConfig:
             password=os.getenv("NEO4J_PASSWORD"),
             database=os.getenv("NEO4J_DATABASE"),
             fulltext_index=os.getenv("NEO4J_FULLTEXT_INDEX", "skos_fulltext"),
+            path_cache_size=int(os.getenv("NEO4J_PATH_CACHE_SIZE", "100000")),
+            path_cache_ttl=float(os.getenv("NEO4J_PATH_CACHE_TTL", "3600")),
+        )
+
+
+class _CompiledGraph:
+    """
+    Compressed-sparse-row view of a fallback adjacency map.
+    Nodes are integer ids; the out-edges of node ``u`` are ``indptr[u]:indptr[u + 1]``.
+    Only nodes that have an adjacency entry (ids below ``source_count``) own edges.
+    """
+
+    __slots__ = (
+        "iri_to_id",
+        "iris",
+        "source_count",
+        "indptr",
+        "indices",
+        "edge_sources",
+        "edge_predicates",
+        "predicates",
+        "labels",
+        "folded_labels",
+    )
+
+    def __init__(self, adjacency: dict[str, list[tuple[str, str, str]]]):
+        self.iri_to_id: dict[str, int] = {iri: idx for idx, iri in enumerate(adjacency)}
+        self.iris: list[str] = list(adjacency)
+        self.source_count = len(adjacency)
+        self.indptr = array("i", [0])
+        self.indices = array("i")
+        self.edge_sources = array("i")
+        self.edge_predicates = array("i")
+        self.predicates: list[str] = []
+        self.labels: list[str] = []
+        predicate_ids: dict[str, int] = {}
+        for source_id, relations in enumerate(adjacency.values()):
+            for predicate, target_iri, target_label in relations:
+                target_id = self.iri_to_id.get(target_iri)
+                if target_id is None:
+                    target_id = self.iri_to_id[target_iri] = len(self.iris)
+                    self.iris.append(target_iri)
+                predicate_id = predicate_ids.get(predicate)
+                if predicate_id is None:
+                    predicate_id = predicate_ids[predicate] = len(self.predicates)
+                    self.predicates.append(predicate)
+                self.indices.append(target_id)
+                self.edge_sources.append(source_id)
+                self.edge_predicates.append(predicate_id)
+                self.labels.append(target_label)
+            self.indptr.append(len(self.indices))
+        self.folded_labels = [label.casefold() for label in self.labels]
+
+    def step(self, edge: int) -> PathStep:
+        return PathStep(
+            subject_iri=self.iris[self.edge_sources[edge]],
+            subject_label=None,
+            predicate=self.predicates[self.edge_predicates[edge]],
+            object_iri=self.iris[self.indices[edge]],
+            object_label=self.labels[edge],
         )
 
 
@@ -39,15 +108,58 @@ class SkosGraphGateway:
     """
     Provides SKOS-aware lookups and path queries against Neo4j.
     Falls back to an in-memory adjacency map (dict[str, list[tuple[predicate, iri, label]]])
-    when Neo4j is not configured.
+    when Neo4j is not configured. The map is compiled into a CSR layout once, at construction.
     """
 
+    # Relation types such as "broader" read as plain English in a sentence.
+    readable_predicates = True
+
+    @property
+    def symmetric_paths(self) -> bool:
+        # The Cypher path queries traverse SKOS relations in both directions, so (a, b) and (b, a)
+        # are equivalent there; the in-memory fallback BFS follows edges as stored.
+        return self.driver is not None
+
     def __init__(self, config: Neo4jConfig, fallback_graph: dict[str, list[tuple[str, str, str]]] | None = None):
         self.config = config
         self.fallback_graph = fallback_graph
+        self._compiled = _CompiledGraph(fallback_graph) if fallback_graph is not None else None
         self.driver: Driver | None = None
         if config.uri and config.user and config.password:
             self.driver = GraphDatabase.driver(config.uri, auth=(config.user, config.password))
+        # Sessions are not thread-safe, so a batch() session is only visible to its own thread.
+        self._local = threading.local()
+        # Neo4j path results (including "no path") keyed on the unordered pair; see _cached_paths.
+        self._path_cache: LRUCache[tuple, list[PathStep] | None] = LRUCache(
+            config.path_cache_size, ttl=config.path_cache_ttl
+        )
+
+    @contextmanager
+    def batch(self) -> Iterator[Session | None]:
+        """Reuse one Neo4j session for every query this thread issues inside the block."""
+        active = getattr(self._local, "session", None)
+        if not self.driver or active is not None:
+            yield active
+            return
+        with self.driver.session(database=self.config.database) as session:  # type: ignore[arg-type]
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        active = getattr(self._local, "session", None)
+        if active is not None:
+            yield active
+            return
+        with self.driver.session(database=self.config.database) as session:  # type: ignore[arg-type, union-attr]
+            yield session
+
+    def clear_path_cache(self) -> None:
+        """Forget cached paths, e.g. after the SKOS graph has been re-imported."""
+        self._path_cache.clear()
 
     def close(self) -> None:
         if self.driver:
@@ -57,7 +169,7 @@ class SkosGraphGateway:
         if not self.driver:
             return {"status": "unconfigured", "details": "Neo4j credentials not provided."}
         try:
-            with self.driver.session(database=self.config.database) as session:
+            with self._session() as session:
                 result = session.run("RETURN 1 AS ok").single()
             if result and result["ok"] == 1:
                 return {"status": "ok"}
@@ -72,6 +184,15 @@ class SkosGraphGateway:
             return self._search_candidates_fallback(surface=surface, limit=limit)
         raise RuntimeError("No graph backend configured for candidate selection.")
 
+    def search_candidates_batch(self, surfaces: list[str], limit: int = 5) -> dict[str, list[Candidate]]:
+        """Look up several surfaces at once; the result maps each input surface to its candidates."""
+        unique = list(dict.fromkeys(surfaces))
+        if self.driver:
+            return self._search_candidates_batch_neo4j(unique, limit=limit)
+        if self.fallback_graph is not None:
+            return self._search_candidates_batch_fallback(unique, limit=limit)
+        raise RuntimeError("No graph backend configured for candidate selection.")
+
     def shortest_path(
         self,
         source_iri: str,
@@ -80,11 +201,69 @@ class SkosGraphGateway:
         hub_threshold: int | None = None,
     ) -> list[PathStep] | None:
         if self.driver:
-            return self._shortest_path_neo4j(source_iri, target_iri, max_hops=max_hops, hub_threshold=hub_threshold)
+            return self._cached_paths([(source_iri, target_iri)], max_hops, hub_threshold)[0]
         if self.fallback_graph is not None:
             return self._shortest_path_fallback(source_iri, target_iri, max_hops=max_hops)
         return None
 
+    def shortest_paths(
+        self,
+        pairs: list[tuple[str, str]],
+        max_hops: int = 2,
+        hub_threshold: int | None = None,
+    ) -> list[list[PathStep] | None]:
+        """Resolve many (source, target) pairs at once; results follow the order of ``pairs``."""
+        if self.driver:
+            return self._cached_paths(pairs, max_hops, hub_threshold)
+        return [self.shortest_path(source, target, max_hops=max_hops, hub_threshold=hub_threshold) for source, target in pairs]
+
+    def _cached_paths(
+        self,
+        pairs: list[tuple[str, str]],
+        max_hops: int,
+        hub_threshold: int | None,
+    ) -> list[list[PathStep] | None]:
+        # Paths are undirected, so (a, b) and (b, a) share an entry stored in sorted orientation
+        # and reversed on the way out. Only pairs that miss the cache go to Neo4j.
+        results: list[list[PathStep] | None] = [None] * len(pairs)
+        pending: dict[tuple, list[int]] = {}
+        for idx, (source, target) in enumerate(pairs):
+            key = (min(source, target), max(source, target), max_hops, hub_threshold)
+            cached = self._path_cache.get(key, _MISSING)
+            if cached is _MISSING:
+                pending.setdefault(key, []).append(idx)
+            else:
+                results[idx] = self._orient(cached, source > target)
+        if pending:
+            keys = list(pending)
+            if len(keys) == 1:
+                found = [self._shortest_path_neo4j(keys[0][0], keys[0][1], max_hops=max_hops, hub_threshold=hub_threshold)]
+            else:
+                found = self._shortest_paths_neo4j([(key[0], key[1]) for key in keys], max_hops=max_hops, hub_threshold=hub_threshold)
+            for key, path in zip(keys, found):
+                self._path_cache.set(key, path)
+                for idx in pending[key]:
+                    source, target = pairs[idx]
+                    results[idx] = self._orient(path, source > target)
+        return results
+
+    @staticmethod
+    def _orient(path: list[PathStep] | None, flipped: bool) -> list[PathStep] | None:
+        if path is None:
+            return None
+        if not flipped:
+            return list(path)
+        return [
+            PathStep(
+                subject_iri=step.object_iri,
+                subject_label=step.object_label,
+                predicate=step.predicate,
+                object_iri=step.subject_iri,
+                object_label=step.subject_label,
+            )
+            for step in reversed(path)
+        ]
+
     def _search_candidates_neo4j(self, surface: str, limit: int) -> list[Candidate]:
         query = """
         CALL db.index.fulltext.queryNodes($index, $term) YIELD node, score
@@ -94,26 +273,75 @@ class SkosGraphGateway:
         ORDER BY score DESC
         LIMIT $limit
         """
-        with self.driver.session(database=self.config.database) as session:  # type: ignore[arg-type]
+        with self._session() as session:
             records = session.run(query, {"index": self.config.fulltext_index, "term": surface, "limit": limit})
-            candidates: list[Candidate] = []
+            return [self._candidate_from_record(record, surface) for record in records]
+
+    def _search_candidates_batch_neo4j(self, surfaces: list[str], limit: int) -> dict[str, list[Candidate]]:
+        results: dict[str, list[Candidate]] = {surface: [] for surface in surfaces}
+        if not surfaces:
+            return results
+        query = """
+        UNWIND $terms AS term
+        CALL {
+            WITH term
+            CALL db.index.fulltext.queryNodes($index, term) YIELD node, score
+            RETURN node, score
+            ORDER BY score DESC
+            LIMIT $limit
+        }
+        RETURN term,
+               coalesce(node.uri, node.iri, toString(id(node))) AS iri,
+               coalesce(node.prefLabel, node.altLabel, node.label, []) AS labels,
+               score
+        ORDER BY score DESC
+        """
+        with self._session() as session:
+            records = session.run(query, {"index": self.config.fulltext_index, "terms": surfaces, "limit": limit})
             for record in records:
-                labels: Iterable[str] = record["labels"] or []
-                first_label = None
-                for lbl in labels:
-                    first_label = lbl
-                    break
-                candidates.append(Candidate(iri=record["iri"], label=first_label or surface, score=record["score"]))
-            return candidates
+                results[record["term"]].append(self._candidate_from_record(record, record["term"]))
+        return results
+
+    def _candidate_from_record(self, record: Any, surface: str) -> Candidate:
+        labels: Iterable[str] = record["labels"] or []
+        first_label = None
+        for lbl in labels:
+            first_label = lbl
+            break
+        return Candidate(iri=record["iri"], label=first_label or surface, score=record["score"])
 
     def _search_candidates_fallback(self, surface: str, limit: int) -> list[Candidate]:
-        # Fallback: naive lexical match over the in-memory graph nodes.
+        # Fallback: naive lexical match over the in-memory graph edges' target labels.
+        graph = self._compiled
+        needle = surface.casefold()
         matches: list[Candidate] = []
-        for iri, relations in self.fallback_graph.items():
-            for _, target_iri, target_label in relations:
-                if surface.lower() in target_label.lower():
-                    matches.append(Candidate(iri=target_iri, label=target_label, score=1.0))
-        return matches[:limit]
+        if limit <= 0:
+            return matches
+        for edge, folded in enumerate(graph.folded_labels):
+            if needle in folded:
+                matches.append(Candidate(iri=graph.iris[graph.indices[edge]], label=graph.labels[edge], score=1.0))
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def _search_candidates_batch_fallback(self, surfaces: list[str], limit: int) -> dict[str, list[Candidate]]:
+        # One sweep over the labels for every surface, stopping once each has ``limit`` matches.
+        graph = self._compiled
+        results: dict[str, list[Candidate]] = {surface: [] for surface in surfaces}
+        if limit <= 0:
+            return results
+        open_needles = [(surface.casefold(), results[surface]) for surface in surfaces]
+        for edge, folded in enumerate(graph.folded_labels):
+            if not open_needles:
+                break
+            hits = [entry for entry in open_needles if entry[0] in folded]
+            if not hits:
+                continue
+            candidate = Candidate(iri=graph.iris[graph.indices[edge]], label=graph.labels[edge], score=1.0)
+            for _, matches in hits:
+                matches.append(candidate)
+            open_needles = [entry for entry in open_needles if len(entry[1]) < limit]
+        return results
 
     def _shortest_path_neo4j(
         self,
@@ -124,18 +352,14 @@ class SkosGraphGateway:
     ) -> list[PathStep] | None:
         hops = max(1, int(max_hops))
         query = f"""
-        MATCH (source {{uri: $source_iri}}) 
+        MATCH (source {{uri: $source_iri}})
         MATCH (target {{uri: $target_iri}})
         MATCH p=shortestPath((source)-[:broader|narrower|related*..{hops}]-(target))
-        WITH p, nodes(p) AS ns, relationships(p) AS rels
-        UNWIND ns AS node
-        WITH p, ns, rels, node, COUNT {{ (node)-[]-() }} AS node_degree
-        WITH p, ns, rels, collect(node_degree) AS degrees
-        WHERE $hub_threshold IS NULL OR ALL(deg IN degrees WHERE deg <= $hub_threshold)
-        RETURN ns AS nodes, rels AS rels
+        WHERE $hub_threshold IS NULL OR none(n IN nodes(p) WHERE COUNT {{ (n)--() }} > $hub_threshold)
+        RETURN nodes(p) AS nodes, relationships(p) AS rels
         LIMIT 1
         """
-        with self.driver.session(database=self.config.database) as session:  # type: ignore[arg-type]
+        with self._session() as session:
             record = session.run(
                 query,
                 {
@@ -147,22 +371,57 @@ class SkosGraphGateway:
             ).single()
             if not record:
                 return None
-            nodes = record["nodes"]
-            rels = record["rels"]
-            steps: list[PathStep] = []
-            for idx, rel in enumerate(rels):
-                subject_node = nodes[idx]
-                object_node = nodes[idx + 1]
-                steps.append(
-                    PathStep(
-                        subject_iri=subject_node.get("uri") or subject_node.get("iri") or str(subject_node.id),
-                        subject_label=self._label_from_node(subject_node),
-                        predicate=rel.type,
-                        object_iri=object_node.get("uri") or object_node.get("iri") or str(object_node.id),
-                        object_label=self._label_from_node(object_node),
-                    )
+            return self._steps_from_path(record["nodes"], record["rels"])
+
+    def _shortest_paths_neo4j(
+        self,
+        pairs: list[tuple[str, str]],
+        max_hops: int,
+        hub_threshold: int | None = None,
+    ) -> list[list[PathStep] | None]:
+        results: list[list[PathStep] | None] = [None] * len(pairs)
+        if not pairs:
+            return results
+        hops = max(1, int(max_hops))
+        # One round-trip for every pair: each UNWIND row runs its own shortestPath so the
+        # planner still sees a single bound source and target per search.
+        query = f"""
+        UNWIND $pairs AS pair
+        MATCH (source {{uri: pair.source}})
+        MATCH (target {{uri: pair.target}})
+        CALL {{
+            WITH source, target
+            MATCH p=shortestPath((source)-[:broader|narrower|related*..{hops}]-(target))
+            WHERE $hub_threshold IS NULL OR none(n IN nodes(p) WHERE COUNT {{ (n)--() }} > $hub_threshold)
+            RETURN nodes(p) AS ns, relationships(p) AS rels
+            LIMIT 1
+        }}
+        RETURN pair.idx AS idx, ns AS nodes, rels AS rels
+        """
+        params = {
+            "pairs": [{"idx": idx, "source": source, "target": target} for idx, (source, target) in enumerate(pairs)],
+            "hub_threshold": hub_threshold,
+        }
+        with self._session() as session:
+            for record in session.run(query, params):
+                results[record["idx"]] = self._steps_from_path(record["nodes"], record["rels"])
+        return results
+
+    def _steps_from_path(self, nodes: list[Any], rels: list[Any]) -> list[PathStep]:
+        steps: list[PathStep] = []
+        for idx, rel in enumerate(rels):
+            subject_node = nodes[idx]
+            object_node = nodes[idx + 1]
+            steps.append(
+                PathStep(
+                    subject_iri=subject_node.get("uri") or subject_node.get("iri") or str(subject_node.id),
+                    subject_label=self._label_from_node(subject_node),
+                    predicate=rel.type,
+                    object_iri=object_node.get("uri") or object_node.get("iri") or str(object_node.id),
+                    object_label=self._label_from_node(object_node),
                 )
-            return steps
+            )
+        return steps
 
     def _label_from_node(self, node: Any) -> str | None:
         for key in ("prefLabel", "altLabel", "label"):
@@ -174,30 +433,36 @@ class SkosGraphGateway:
         return None
 
     def _shortest_path_fallback(self, source_iri: str, target_iri: str, max_hops: int) -> list[PathStep] | None:
-        if source_iri not in self.fallback_graph or target_iri not in self.fallback_graph:
+        graph = self._compiled
+        source = graph.iri_to_id.get(source_iri)
+        target = graph.iri_to_id.get(target_iri)
+        if source is None or target is None or source >= graph.source_count or target >= graph.source_count:
             return None
-        visited = set()
-        queue: deque[tuple[str, list[PathStep]]] = deque()
-        queue.append((source_iri, []))
+        # Parent pointers (node -> discovering edge) instead of per-entry path copies; the path
+        # is rebuilt once at the target.
+        parent_edge: dict[int, int] = {source: -1}
+        depth = {source: 0}
+        queue: deque[int] = deque([source])
+        indptr, indices = graph.indptr, graph.indices
 
         while queue:
-            current, path = queue.popleft()
-            if len(path) > max_hops:
-                continue
-            if current == target_iri:
+            node = queue.popleft()
+            if node == target:
+                path: list[PathStep] = []
+                edge = parent_edge[node]
+                while edge >= 0:
+                    path.append(graph.step(edge))
+                    edge = parent_edge[graph.edge_sources[edge]]
+                path.reverse()
                 return path
-
-            if current in visited:
+            if depth[node] >= max_hops or node >= graph.source_count:
                 continue
-            visited.add(current)
-
-            for predicate, next_iri, next_label in self.fallback_graph.get(current, []):
-                next_step = PathStep(
-                    subject_iri=current,
-                    subject_label=None,
-                    predicate=predicate,
-                    object_iri=next_iri,
-                    object_label=next_label,
-                )
-                queue.append((next_iri, path + [next_step]))
+
+            for edge in range(indptr[node], indptr[node + 1]):
+                next_node = indices[edge]
+                if next_node in parent_edge:
+                    continue
+                parent_edge[next_node] = edge
+                depth[next_node] = depth[node] + 1
+                queue.append(next_node)
         return None
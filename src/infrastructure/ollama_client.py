@@ -3,12 +3,14 @@ from __future__ import annotations
 import csv
 import json
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 
 def _int_from_env(name: str) -> int | None:
@@ -76,6 +78,11 @@ class OllamaClientConfig:
     model: str
     csv_path: Path
     options: OllamaOptions
+    # Mirrors the Ollama server's OLLAMA_NUM_PARALLEL: how many requests it decodes at once.
+    num_parallel: int | None = None
+    # How long Ollama keeps the model loaded after a call (e.g. "30m", "-1"). Every stage sends the
+    # same system prompt first, so a resident model can reuse that prefix from its prompt cache.
+    keep_alive: str | None = None
 
     @classmethod
     def from_env(cls) -> "OllamaClientConfig":
@@ -97,6 +104,8 @@ class OllamaClientConfig:
             model=model,
             csv_path=csv_path,
             options=options,
+            num_parallel=_int_from_env("OLLAMA_NUM_PARALLEL"),
+            keep_alive=os.getenv("OLLAMA_KEEP_ALIVE") or None,
         )
 
 
@@ -107,6 +116,14 @@ class OllamaClient:
 
     def __init__(self, config: OllamaClientConfig):
         self.config = config
+        # One keep-alive session per client so consecutive pipeline stages reuse connections;
+        # the pool is sized to cover the concurrent decision/path-translation calls.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, config.num_parallel or 0))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # generate() may be called from several threads; serialize CSV appends.
+        self._csv_lock = threading.Lock()
 
     def generate(
         self,
@@ -128,13 +145,18 @@ class OllamaClient:
         options_payload = self.config.options.to_payload()
         if options_payload:
             payload["options"] = options_payload
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
 
-        response = requests.post(target_url, json=payload)
+        response = self._session.post(target_url, json=payload)
         response.raise_for_status()
         data = self._parse_response(response)
         self._log_to_csv(data, prompt_name=prompt_name, input_text=input_text)
         return data
 
+    def close(self) -> None:
+        self._session.close()
+
     def _parse_response(self, response: Response) -> dict[str, Any]:
         try:
             return response.json()
@@ -143,7 +165,7 @@ class OllamaClient:
 
     def health_check(self) -> dict[str, Any]:
         try:
-            response = requests.get(f"{self.config.url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.config.url}/api/tags", timeout=5)
             response.raise_for_status()
             return {"status": "ok"}
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -172,32 +194,33 @@ class OllamaClient:
             "rdf_valid",
             "rdf_note",
         ]
-        write_header = not csv_path.exists()
         response_text = data.get("response")
         rdf_valid = _is_likely_turtle(response_text)
         rdf_note = "" if rdf_valid else "Response not recognized as RDF/Turtle."
-        with csv_path.open("a", encoding="utf-8", newline="") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if write_header:
-                writer.writeheader()
-            writer.writerow(
-                {
-                    "prompt_name": prompt_name,
-                    "input_text": input_text,
-                    "model": data.get("model"),
-                    "created_at": data.get("created_at"),
-                    "response": data.get("response"),
-                    "thinking": data.get("thinking"),
-                    "done": data.get("done"),
-                    "done_reason": data.get("done_reason"),
-                    "total_duration": data.get("total_duration"),
-                    "load_duration": data.get("load_duration"),
-                    "prompt_eval_count": data.get("prompt_eval_count"),
-                    "prompt_eval_duration": data.get("prompt_eval_duration"),
-                    "eval_count": data.get("eval_count"),
-                    "eval_duration": data.get("eval_duration"),
-                    "logprobs": json.dumps(data.get("logprobs")),
-                    "rdf_valid": rdf_valid,
-                    "rdf_note": rdf_note,
-                }
-            )
+        with self._csv_lock:
+            write_header = not csv_path.exists()
+            with csv_path.open("a", encoding="utf-8", newline="") as csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+                if write_header:
+                    writer.writeheader()
+                writer.writerow(
+                    {
+                        "prompt_name": prompt_name,
+                        "input_text": input_text,
+                        "model": data.get("model"),
+                        "created_at": data.get("created_at"),
+                        "response": data.get("response"),
+                        "thinking": data.get("thinking"),
+                        "done": data.get("done"),
+                        "done_reason": data.get("done_reason"),
+                        "total_duration": data.get("total_duration"),
+                        "load_duration": data.get("load_duration"),
+                        "prompt_eval_count": data.get("prompt_eval_count"),
+                        "prompt_eval_duration": data.get("prompt_eval_duration"),
+                        "eval_count": data.get("eval_count"),
+                        "eval_duration": data.get("eval_duration"),
+                        "logprobs": json.dumps(data.get("logprobs")),
+                        "rdf_valid": rdf_valid,
+                        "rdf_note": rdf_note,
+                    }
+                )
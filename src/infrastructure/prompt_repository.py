@@ -1,23 +1,61 @@
+import stat
+import threading
 from pathlib import Path
+from typing import Iterable
 
 
 class PromptRepository:
     """
     Infrastructure layer for reading prompt files.
     Prevents path traversal and provides clear errors to the application layer.
+    Loaded prompts are cached and re-read only when the file's mtime changes.
     """
 
     def __init__(self, prompt_dir: Path | None = None) -> None:
         # Default to repository root / prompt directory
         base_dir = Path(__file__).resolve().parents[2]
         self.prompt_dir = prompt_dir or (base_dir / "prompt")
+        # prompt_name -> (resolved path, mtime_ns, stripped text)
+        self._cache: dict[str, tuple[Path, int, str]] = {}
+        self._lock = threading.Lock()
 
     def load_prompt(self, prompt_name: str) -> str:
-        prompt_path = (self.prompt_dir / prompt_name).resolve()
-        if self.prompt_dir not in prompt_path.parents:
-            raise ValueError(f"Prompt path {prompt_name!r} is outside the prompt directory.")
+        with self._lock:
+            cached = self._cache.get(prompt_name)
+        prompt_path = cached[0] if cached else self._resolve(prompt_name)
 
-        if not prompt_path.is_file():
+        try:
+            st = prompt_path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            with self._lock:
+                self._cache.pop(prompt_name, None)
             raise FileNotFoundError(f"Prompt {prompt_name!r} not found at {prompt_path}.")
 
-        return prompt_path.read_text(encoding="utf-8").strip()
+        if cached and cached[1] == st.st_mtime_ns:
+            return cached[2]
+
+        text = prompt_path.read_text(encoding="utf-8").strip()
+        with self._lock:
+            self._cache[prompt_name] = (prompt_path, st.st_mtime_ns, text)
+        return text
+
+    def preload(self, prompt_names: Iterable[str]) -> None:
+        """Warm the cache; prompts that cannot be loaded are left to fail on first use."""
+        for prompt_name in prompt_names:
+            try:
+                self.load_prompt(prompt_name)
+            except (OSError, ValueError):
+                continue
+
+    def reload(self) -> None:
+        """Drop every cached prompt so the next load reads from disk."""
+        with self._lock:
+            self._cache.clear()
+
+    def _resolve(self, prompt_name: str) -> Path:
+        prompt_path = (self.prompt_dir / prompt_name).resolve()
+        if self.prompt_dir not in prompt_path.parents:
+            raise ValueError(f"Prompt path {prompt_name!r} is outside the prompt directory.")
+        return prompt_path
@@ -2,11 +2,29 @@ from __future__ import annotations
 
 import hashlib
 import re
-
-from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef, XSD
+from typing import Iterable
+from urllib.parse import quote
 
 from ..domain.models import DisambiguatedMention, RDFGraphResult
 
+_RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+_RDFS_LABEL = "http://www.w3.org/2000/01/rdf-schema#label"
+
+
+class _IRI(str):
+    """Marks an object as a resource rather than a string literal; never equal to a plain ``str``."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _IRI and str.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((_IRI, str(self)))
+
 
 class RDFBuilder:
     """
@@ -23,76 +41,164 @@ class RDFBuilder:
         flags=re.IGNORECASE,
     )
 
+    _PREFIXES = {
+        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+        "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+        "skos": "http://www.w3.org/2004/02/skos/core#",
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+    }
+    # Local names simple enough to emit as prefixed names in both Turtle and JSON-LD.
+    _LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+    # Characters allowed in a Turtle IRIREF (no escapes); concept IRIs come from the LLM, so anything else is dropped.
+    _IRIREF = re.compile(r'[^\x00-\x20<>"{}|^`\\]+')
+    _TURTLE_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
     def __init__(self, base_namespace: str = "http://example.org/"):
         self.base_namespace = base_namespace if base_namespace.endswith("/") else f"{base_namespace}/"
-        self.ex = Namespace(self.base_namespace)
-        self.skos = Namespace("http://www.w3.org/2004/02/skos/core#")
+        self._prefixes = {"ex": self.base_namespace, **self._PREFIXES}
+        # Only a handful of distinct predicates and classes occur, so their compact forms are memoized.
+        self._compacted: dict[str, str | None] = {}
 
     def build(
         self,
         text: str,
         disambiguated_mentions: list[DisambiguatedMention],
+        document_id: str | None = None,
     ) -> RDFGraphResult:
-        graph = Graph()
-        graph.bind("ex", self.ex)
-        graph.bind("skos", self.skos)
-        graph.bind("rdfs", RDFS)
-
-        doc_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        document_uri = URIRef(f"{self.ex}Document/{doc_hash}")
-        graph.add((document_uri, RDF.type, URIRef(f"{self.ex}Document")))
+        # The graph is a small fixed schema that is written once and never queried, so triples
+        # are plain strings kept in insertion order (the dict only drops duplicates) and
+        # serialized by hand; objects are literals unless wrapped in ``_IRI``.
+        graph: dict[tuple[str, str, object], None] = {}
+        ex = self.base_namespace
+
+        # The hash is only a stable URI suffix, so a 128-bit BLAKE2b digest is plenty;
+        # a caller-supplied id (the request's idempotence key) skips hashing altogether.
+        if document_id:
+            doc_hash = quote(document_id, safe="")
+        else:
+            doc_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        document_uri = _IRI(f"{ex}Document/{doc_hash}")
+        graph[(document_uri, _RDF_TYPE, _IRI(f"{ex}Document"))] = None
 
         for idx, mention in enumerate(disambiguated_mentions):
-            mention_uri = URIRef(f"{self.ex}Mention/{doc_hash}/{idx}")
-            graph.add((mention_uri, RDF.type, URIRef(f"{self.ex}Mention")))
-            graph.add((mention_uri, RDFS.label, Literal(mention.surface)))
-            graph.add((document_uri, URIRef(f"{self.ex}mentions"), mention_uri))
+            mention_uri = _IRI(f"{ex}Mention/{doc_hash}/{idx}")
+            graph[(mention_uri, _RDF_TYPE, _IRI(f"{ex}Mention"))] = None
+            graph[(mention_uri, _RDFS_LABEL, mention.surface)] = None
+            graph[(document_uri, f"{ex}mentions", mention_uri)] = None
 
             if mention.evidence and mention.evidence.summary:
-                graph.add((mention_uri, URIRef(f"{self.ex}pathSummary"), Literal(mention.evidence.summary)))
+                graph[(mention_uri, f"{ex}pathSummary", mention.evidence.summary)] = None
 
-            if mention.chosen:
-                concept_uri = URIRef(mention.chosen.iri)
-                graph.add((mention_uri, URIRef(f"{self.ex}denotes"), concept_uri))
-                graph.add((document_uri, URIRef(f"{self.ex}hasTopic"), concept_uri))
+            if mention.chosen and self._is_valid_iri(mention.chosen.iri):
+                concept_uri = _IRI(mention.chosen.iri)
+                graph[(mention_uri, f"{ex}denotes", concept_uri)] = None
+                graph[(document_uri, f"{ex}hasTopic", concept_uri)] = None
                 if mention.chosen.label:
-                    graph.add((concept_uri, RDFS.label, Literal(mention.chosen.label)))
+                    graph[(concept_uri, _RDFS_LABEL, mention.chosen.label)] = None
 
             # Offsets (optional)
             if mention.start is not None:
-                graph.add((mention_uri, URIRef(f"{self.ex}startOffset"), Literal(int(mention.start), datatype=XSD.integer)))
+                graph[(mention_uri, f"{ex}startOffset", int(mention.start))] = None
             if mention.end is not None:
-                graph.add((mention_uri, URIRef(f"{self.ex}endOffset"), Literal(int(mention.end), datatype=XSD.integer)))
+                graph[(mention_uri, f"{ex}endOffset", int(mention.end))] = None
 
         mention_entities = self._mention_entity_index(disambiguated_mentions)
         for idx, assertion in enumerate(self._extract_assertions(text, mention_entities)):
-            assertion_uri = URIRef(f"{self.ex}Assertion/{doc_hash}/{idx}")
-            graph.add((assertion_uri, RDF.type, URIRef(f"{self.ex}Assertion")))
-            graph.add((document_uri, URIRef(f"{self.ex}asserts"), assertion_uri))
-            graph.add((assertion_uri, URIRef(f"{self.ex}copulaVerb"), Literal(assertion["verb"])))
-            graph.add((assertion_uri, URIRef(f"{self.ex}negated"), Literal(bool(assertion["negated"]), datatype=XSD.boolean)))
-            graph.add((assertion_uri, URIRef(f"{self.ex}surfaceText"), Literal(assertion["surface_text"])))
+            assertion_uri = _IRI(f"{ex}Assertion/{doc_hash}/{idx}")
+            graph[(assertion_uri, _RDF_TYPE, _IRI(f"{ex}Assertion"))] = None
+            graph[(document_uri, f"{ex}asserts", assertion_uri)] = None
+            graph[(assertion_uri, f"{ex}copulaVerb", assertion["verb"])] = None
+            graph[(assertion_uri, f"{ex}negated", bool(assertion["negated"]))] = None
+            graph[(assertion_uri, f"{ex}surfaceText", assertion["surface_text"])] = None
 
             subject_uri = assertion.get("subject_uri")
             object_uri = assertion.get("object_uri")
             context_uri = assertion.get("context_uri")
             if subject_uri:
-                graph.add((assertion_uri, URIRef(f"{self.ex}subject"), URIRef(subject_uri)))
+                graph[(assertion_uri, f"{ex}subject", _IRI(subject_uri))] = None
             if object_uri:
-                graph.add((assertion_uri, URIRef(f"{self.ex}object"), URIRef(object_uri)))
+                graph[(assertion_uri, f"{ex}object", _IRI(object_uri))] = None
             if context_uri:
-                graph.add((assertion_uri, URIRef(f"{self.ex}contextEntity"), URIRef(context_uri)))
-                graph.add((assertion_uri, URIRef(f"{self.ex}contextPreposition"), Literal(assertion["prep"])))
+                graph[(assertion_uri, f"{ex}contextEntity", _IRI(context_uri))] = None
+                graph[(assertion_uri, f"{ex}contextPreposition", assertion["prep"])] = None
 
-        turtle = graph.serialize(format="turtle")
-        jsonld = graph.serialize(format="json-ld")
+        subjects = self._group_by_subject(graph)
+        turtle = self._to_turtle(subjects)
+        jsonld = self._to_jsonld(subjects)
 
         return RDFGraphResult(document_uri=str(document_uri), turtle=turtle, jsonld=jsonld)
 
+    def _group_by_subject(self, triples: Iterable[tuple[str, str, object]]) -> dict[str, dict[str, list[object]]]:
+        subjects: dict[str, dict[str, list[object]]] = {}
+        for subject, predicate, obj in triples:
+            subjects.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+        return subjects
+
+    def _compact(self, iri: str) -> str | None:
+        try:
+            return self._compacted[iri]
+        except KeyError:
+            pass
+        compacted = None
+        for prefix, namespace in self._prefixes.items():
+            if iri.startswith(namespace) and self._LOCAL_NAME.fullmatch(iri[len(namespace) :]):
+                compacted = f"{prefix}:{iri[len(namespace):]}"
+                break
+        # Vocabulary terms land here on the first build; the bound keeps per-document IRIs from piling up.
+        if len(self._compacted) < 1024:
+            self._compacted[iri] = compacted
+        return compacted
+
+    def _turtle_iri(self, iri: str) -> str:
+        return self._compact(iri) or f"<{iri}>"
+
+    def _turtle_object(self, obj: object) -> str:
+        if isinstance(obj, _IRI):
+            return self._turtle_iri(obj)
+        if isinstance(obj, bool):
+            return "true" if obj else "false"
+        if isinstance(obj, int):
+            return str(obj)
+        return f'"{str(obj).translate(self._TURTLE_ESCAPES)}"'
+
+    def _to_turtle(self, subjects: dict[str, dict[str, list[object]]]) -> str:
+        parts = [f"@prefix {prefix}: <{namespace}> .\n" for prefix, namespace in self._prefixes.items()]
+        emit = parts.append
+        for subject, predicates in subjects.items():
+            emit(f"\n{self._turtle_iri(subject)} ")
+            separator = ""
+            for predicate, objects in predicates.items():
+                verb = "a" if predicate == _RDF_TYPE else self._turtle_iri(predicate)
+                emit(f"{separator}{verb} {', '.join(self._turtle_object(obj) for obj in objects)}")
+                separator = " ;\n    "
+            emit(" .\n")
+        return "".join(parts)
+
+    def _jsonld_object(self, obj: object) -> dict:
+        if isinstance(obj, _IRI):
+            return {"@id": str(obj)}
+        return {"@value": obj}
+
+    def _to_jsonld(self, subjects: dict[str, dict[str, list[object]]]) -> dict:
+        nodes: list[dict] = []
+        for subject, predicates in subjects.items():
+            node: dict = {"@id": subject}
+            for predicate, objects in predicates.items():
+                if predicate == _RDF_TYPE:
+                    node["@type"] = [self._compact(obj) or str(obj) for obj in objects]
+                else:
+                    node[self._compact(predicate) or predicate] = [self._jsonld_object(obj) for obj in objects]
+            nodes.append(node)
+        # Kept as a document object so responses embed it once instead of as an escaped JSON string.
+        return {"@context": dict(self._prefixes), "@graph": nodes}
+
+    def _is_valid_iri(self, iri: str | None) -> bool:
+        return bool(iri) and self._IRIREF.fullmatch(iri) is not None
+
     def _mention_entity_index(self, disambiguated_mentions: list[DisambiguatedMention]) -> dict[str, str]:
         index: dict[str, str] = {}
         for mention in disambiguated_mentions:
-            if mention.chosen and mention.surface:
+            if mention.chosen and mention.surface and self._is_valid_iri(mention.chosen.iri):
                 index[mention.surface.casefold()] = mention.chosen.iri
         return index
 
@@ -1,28 +1,143 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+import weakref
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+import orjson
+
+_UTC = timezone.utc
+
+
+class _LogSink:
+    """
+    Pending lines plus the long-lived O_APPEND descriptor they are written to.
+    Kept apart from RequestLogger so its finalizer can drain and close it without holding the logger alive.
+    """
+
+    __slots__ = ("path", "buffer", "lock", "_fd")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.buffer: deque[bytes] = deque()
+        self.lock = threading.Lock()
+        self._fd: int | None = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _get_fd(self) -> int:
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+            try:
+                self._fd = os.open(self.path, flags, 0o644)
+            except FileNotFoundError:
+                # The directory was removed since start-up (e.g. by log cleanup); recreate it once.
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, flags, 0o644)
+        return self._fd
+
+    def write_pending(self) -> None:
+        """Write every buffered line with one raw write; the caller holds ``lock``."""
+        if not self.buffer:
+            return
+        # Lines are already batched, so a Python-level write buffer would only add a copy.
+        data = memoryview(b"".join(self.buffer))
+        try:
+            fd = self._get_fd()
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            # Keep only what did not reach the file, so a failed write is retried without duplicating lines.
+            self.buffer.clear()
+            if data:
+                self.buffer.append(bytes(data))
+
+    def close(self) -> None:
+        with self.lock:
+            self.write_pending()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+def _flush_later(ref: weakref.ref[RequestLogger]) -> None:
+    # Timer callback; a weak reference so a pending flush does not keep the logger alive.
+    logger = ref()
+    if logger is not None:
+        logger.flush()
 
 
 class RequestLogger:
     """
     Simple JSONL logger to group Ollama and Neo4j calls by idempotence key.
+    Lines are buffered in memory and written together once ``flush_size`` lines are
+    pending or ``flush_interval`` seconds have passed; call ``flush()`` to drain early.
     """
 
-    def __init__(self, log_path: Path | None):
+    def __init__(self, log_path: Path | None, flush_size: int = 64, flush_interval: float = 1.0):
         self.log_path = log_path
+        self.flush_size = max(1, int(flush_size))
+        self.flush_interval = flush_interval
+        self._sink = _LogSink(log_path) if log_path else None
+        self._timer: threading.Timer | None = None
+        if self._sink is not None:
+            # Runs on garbage collection or at interpreter exit, whichever comes first.
+            self._finalizer = weakref.finalize(self, self._sink.close)
 
     def log(self, idempotence_key: str, event: str, payload: dict[str, Any]) -> None:
-        if not self.log_path:
+        self.log_batch(idempotence_key, [(datetime.now(_UTC), event, payload)])
+
+    def log_batch(self, idempotence_key: str, events: Iterable[tuple[datetime | str, str, dict[str, Any]]]) -> None:
+        """
+        Queue several ``(timestamp, event, payload)`` entries; they are written in order.
+        Datetime timestamps are serialized by orjson as ISO 8601, with ``Z`` for UTC.
+        """
+        sink = self._sink
+        if sink is None:
+            return
+        # orjson emits UTF-8 bytes directly, so lines go to the file without a text-encoding pass.
+        lines = [
+            orjson.dumps(
+                {"timestamp": timestamp, "idempotence_key": idempotence_key, "event": event, "payload": payload},
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE,
+            )
+            for timestamp, event, payload in events
+        ]
+        if not lines:
             return
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "idempotence_key": idempotence_key,
-            "event": event,
-            "payload": payload,
-        }
-        with self.log_path.open("a", encoding="utf-8") as fp:
-            fp.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        # Pipeline stages log from worker threads; the sink lock guards the buffer, timer and handle.
+        with sink.lock:
+            sink.buffer.extend(lines)
+            if len(sink.buffer) >= self.flush_size or self.flush_interval <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, _flush_later, args=(weakref.ref(self),))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write every pending line now."""
+        if self._sink is None:
+            return
+        with self._sink.lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Write pending lines and release the file handle; logging again reopens it."""
+        if self._sink is None:
+            return
+        with self._sink.lock:
+            self._cancel_timer()
+        self._sink.close()
+
+    def _flush_locked(self) -> None:
+        self._cancel_timer()
+        self._sink.write_pending()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -46,6 +46,14 @@ class WikidataGateway:
     breadth-first traversal over item-valued claims returned by ``wbgetentities``.
     """
 
+    # Claim traversal is directed, so (a, b) and (b, a) must both be searched.
+    symmetric_paths = False
+    # Path steps carry property ids (e.g. "P279"), which cannot be verbalized without the LLM.
+    readable_predicates = False
+
+    # wbgetentities accepts at most 50 ids per request.
+    _MAX_IDS_PER_REQUEST = 50
+
     def __init__(self, config: WikidataConfig):
         self.config = config
         self.headers = {"User-Agent": self.config.user_agent}
@@ -108,18 +116,24 @@ class WikidataGateway:
         if not source_id or not target_id or source_id == target_id:
             return None
 
+        self._fetch_entities([source_id, target_id])
         max_depth = max(1, int(max_hops))
-        queue: deque[tuple[str, list[PathStep]]] = deque([(source_id, [])])
-        visited = {source_id}
+        # parent maps each discovered entity to (previous entity, step into it); the path is
+        # rebuilt once when the target is reached.
+        parent: dict[str, tuple[str, PathStep] | None] = {source_id: None}
+        depth = {source_id: 0}
+        queue: deque[str] = deque([source_id])
 
         while queue:
-            current_id, path = queue.popleft()
-            if len(path) >= max_depth:
+            current_id = queue.popleft()
+            if depth[current_id] >= max_depth:
                 continue
 
             neighbors = self._claim_neighbors(current_id, hub_threshold=hub_threshold)
+            # Resolve every neighbor label in one batched request instead of one request each.
+            self._fetch_entities([neighbor_id for _, neighbor_id in neighbors if neighbor_id not in parent])
             for predicate, neighbor_id in neighbors:
-                if neighbor_id in visited:
+                if neighbor_id in parent:
                     continue
 
                 step = PathStep(
@@ -129,15 +143,39 @@ class WikidataGateway:
                     object_iri=self._entity_iri(neighbor_id),
                     object_label=self._label_for(neighbor_id),
                 )
-                next_path = [*path, step]
+                parent[neighbor_id] = (current_id, step)
                 if neighbor_id == target_id:
-                    return next_path
+                    return self._path_to(parent, neighbor_id)
 
-                visited.add(neighbor_id)
-                queue.append((neighbor_id, next_path))
+                depth[neighbor_id] = depth[current_id] + 1
+                queue.append(neighbor_id)
 
         return None
 
+    def _path_to(self, parent: dict[str, tuple[str, PathStep] | None], entity_id: str) -> list[PathStep]:
+        path: list[PathStep] = []
+        link = parent[entity_id]
+        while link is not None:
+            previous_id, step = link
+            path.append(step)
+            link = parent[previous_id]
+        path.reverse()
+        return path
+
+    def shortest_paths(
+        self,
+        pairs: list[tuple[str, str]],
+        max_hops: int = 2,
+        hub_threshold: int | None = None,
+    ) -> list[list[PathStep] | None]:
+        """Resolve many (source, target) pairs, prefetching all endpoint entities up front."""
+        endpoint_ids = [self._entity_id_from_iri(iri) for pair in pairs for iri in pair]
+        self._fetch_entities([entity_id for entity_id in endpoint_ids if entity_id])
+        return [
+            self.shortest_path(source_iri, target_iri, max_hops=max_hops, hub_threshold=hub_threshold)
+            for source_iri, target_iri in pairs
+        ]
+
     def _entity_id_from_iri(self, iri: str) -> str | None:
         match = re.search(r"(Q\d+)(?:$|[/?#])", iri)
         return match.group(1) if match else None
@@ -164,12 +202,37 @@ class WikidataGateway:
             self._entity_cache[entity_id] = {}
             return {}
         entity = (data.get("entities") or {}).get(entity_id) or {}
-        self._entity_cache[entity_id] = entity
+        self._store_entity(entity_id, entity)
+        return entity
 
+    def _fetch_entities(self, entity_ids: list[str]) -> None:
+        missing = list(dict.fromkeys(entity_id for entity_id in entity_ids if entity_id not in self._entity_cache))
+        for start in range(0, len(missing), self._MAX_IDS_PER_REQUEST):
+            chunk = missing[start : start + self._MAX_IDS_PER_REQUEST]
+            if len(chunk) == 1:
+                self._fetch_entity(chunk[0])
+                continue
+            params = {
+                "action": "wbgetentities",
+                "ids": "|".join(chunk),
+                "props": "claims|labels",
+                "languages": self.config.language,
+                "format": "json",
+                "origin": "*",
+            }
+            try:
+                data = self._request_json(params)
+            except requests.RequestException:
+                data = {}
+            entities = data.get("entities") or {}
+            for entity_id in chunk:
+                self._store_entity(entity_id, entities.get(entity_id) or {})
+
+    def _store_entity(self, entity_id: str, entity: dict[str, Any]) -> None:
+        self._entity_cache[entity_id] = entity
         label = ((entity.get("labels") or {}).get(self.config.language) or {}).get("value")
         if label:
             self._label_cache[entity_id] = label
-        return entity
 
     def _label_for(self, entity_id: str) -> str | None:
         if entity_id not in self._label_cache:
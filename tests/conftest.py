@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    # Imported on first use so collecting the unit tests does not pull in the whole app.
+    import src.app
+
+    return src.app
+
+
+@pytest.fixture(scope="session")
+def app_factory(app_module):
+    return app_module.create_app
@@ -1,4 +1,5 @@
-import json
+import orjson
+import pytest
 from flask import Flask
 
 from src.controllers.analyze_controller import create_analyze_blueprint
@@ -14,53 +15,67 @@ from src.domain.models import (
 )
 
 
+_JSON = "application/json"
+
+# The stub's canned pieces are immutable, so they are built once at import.
+_CANDIDATE = Candidate(iri="http://example.org/ai", label="Artificial Intelligence", score=0.95)
+_MENTIONS = MentionExtraction(mentions=[Mention(surface="AI", label="Field", start=0, end=2, confidence=0.9)])
+_CANDIDATES = [MentionCandidates(surface="AI", candidates=[_CANDIDATE])]
+_DISAMBIGUATION = [
+    DisambiguatedMention(
+        surface="AI",
+        label="Field",
+        start=0,
+        end=2,
+        confidence=0.9,
+        chosen=_CANDIDATE,
+        evidence=PathEvidence(paths=[], summary="summary"),
+    )
+]
+_RDF = RDFGraphResult(
+    document_uri="http://example.org/Document/123",
+    turtle="@prefix ex: <http://example.org/> .",
+    jsonld={},
+)
+_GENERATION = {"ner": {"response": "{}"}}
+
+
 class StubService:
     def __init__(self):
         self.called_with = None
 
     def analyze(self, request):
         self.called_with = request
-        mentions = MentionExtraction(mentions=[Mention(surface="AI", label="Field", start=0, end=2, confidence=0.9)])
-        candidates = [MentionCandidates(surface="AI", candidates=[Candidate(iri="http://example.org/ai", label="Artificial Intelligence", score=0.95)])]
-        disambiguation = [
-            DisambiguatedMention(
-                surface="AI",
-                label="Field",
-                start=0,
-                end=2,
-                confidence=0.9,
-                chosen=Candidate(iri="http://example.org/ai", label="Artificial Intelligence", score=0.95),
-                evidence=PathEvidence(paths=[], summary="summary"),
-            )
-        ]
-        rdf = RDFGraphResult(
-            document_uri="http://example.org/Document/123",
-            turtle="@prefix ex: <http://example.org/> .",
-            jsonld="{}",
-        )
         return AnalyzeResponse(
             text=request.text,
-            mentions=mentions,
-            candidate_selections=candidates,
-            disambiguation=disambiguation,
-            rdf=rdf,
-            generation={"ner": {"response": "{}"}},
+            mentions=_MENTIONS,
+            candidate_selections=_CANDIDATES,
+            disambiguation=_DISAMBIGUATION,
+            rdf=_RDF,
+            generation=_GENERATION,
         )
 
     def health(self):
         return {"wikidata": {"status": "ok"}, "llm": {"status": "ok"}}
 
 
-def make_client():
+@pytest.fixture(scope="module")
+def app_client():
     service = StubService()
     app = Flask(__name__)
     app.register_blueprint(create_analyze_blueprint(service))
     app.config.update({"TESTING": True})
-    return app.test_client(), service
+    with app.test_client() as client:
+        yield client, service
+
+
+@pytest.fixture(autouse=True)
+def reset_stub(app_client):
+    app_client[1].called_with = None
 
 
-def test_health_ok():
-    client, _ = make_client()
+def test_health_ok(app_client):
+    client, _ = app_client
     resp = client.get("/health")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -68,10 +83,10 @@ def test_health_ok():
     assert data["llm"]["status"] == "ok"
 
 
-def test_analyze_happy_path():
-    client, service = make_client()
+def test_analyze_happy_path(app_client):
+    client, service = app_client
     payload = {"text": "AI improves science", "prompt_name": "ner", "top_k": 3}
-    resp = client.post("/analyze", data=json.dumps(payload), content_type="application/json")
+    resp = client.post("/analyze", data=orjson.dumps(payload), content_type=_JSON)
 
     assert resp.status_code == 200
     data = resp.get_json()
@@ -80,14 +95,15 @@ def test_analyze_happy_path():
     assert service.called_with.top_k == 3
 
 
-def test_analyze_missing_text_returns_400():
-    client, _ = make_client()
-    resp = client.post("/analyze", data=json.dumps({}), content_type="application/json")
+def test_analyze_missing_text_returns_400(app_client):
+    client, service = app_client
+    resp = client.post("/analyze", data=orjson.dumps({}), content_type=_JSON)
     assert resp.status_code == 400
     assert "text" in resp.get_json()["error"]
+    assert service.called_with is None
 
 
-def test_analyze_validates_numeric_fields():
-    client, _ = make_client()
-    resp = client.post("/analyze", data=json.dumps({"text": "abc", "top_k": 0}), content_type="application/json")
+def test_analyze_validates_numeric_fields(app_client):
+    client, _ = app_client
+    resp = client.post("/analyze", data=orjson.dumps({"text": "abc", "top_k": 0}), content_type=_JSON)
     assert resp.status_code == 400
@@ -0,0 +1,166 @@
+from src.infrastructure.neo4j_client import Neo4jConfig, SkosGraphGateway
+
+
+def _fallback_gateway() -> SkosGraphGateway:
+    graph = {
+        "ex:a": [("broader", "ex:b", "B"), ("related", "ex:c", "C")],
+        "ex:b": [("broader", "ex:d", "D")],
+        "ex:c": [("broader", "ex:d", "D")],
+        "ex:d": [("broader", "ex:e", "E")],
+        "ex:e": [],
+    }
+    return SkosGraphGateway(Neo4jConfig(uri=None, user=None, password=None, database=None), fallback_graph=graph)
+
+
+def test_fallback_shortest_path_follows_first_discovered_route():
+    gateway = _fallback_gateway()
+
+    path = gateway.shortest_path("ex:a", "ex:d", max_hops=2)
+
+    assert [(step.subject_iri, step.predicate, step.object_iri) for step in path] == [
+        ("ex:a", "broader", "ex:b"),
+        ("ex:b", "broader", "ex:d"),
+    ]
+    assert path[-1].object_label == "D"
+
+
+def test_fallback_shortest_path_respects_max_hops():
+    gateway = _fallback_gateway()
+
+    assert gateway.shortest_path("ex:a", "ex:e", max_hops=2) is None
+    assert len(gateway.shortest_path("ex:a", "ex:e", max_hops=3)) == 3
+    assert gateway.shortest_path("ex:a", "ex:a", max_hops=2) == []
+    assert gateway.shortest_paths([("ex:a", "ex:b"), ("ex:e", "ex:a")], max_hops=2)[1] is None
+
+
+def test_fallback_search_matches_edge_labels_case_insensitively():
+    gateway = _fallback_gateway()
+
+    assert [c.iri for c in gateway.search_candidates("d", limit=5)] == ["ex:d", "ex:d"]
+    assert [c.iri for c in gateway.search_candidates("D", limit=1)] == ["ex:d"]
+    assert gateway.search_candidates("missing") == []
+
+
+def test_batch_reuses_one_session_per_thread():
+    opened = []
+
+    class FakeResult:
+        def single(self):
+            return None
+
+    class FakeSession:
+        def __enter__(self):
+            opened.append(self)
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def run(self, query, params=None):
+            return FakeResult()
+
+    class FakeDriver:
+        def session(self, database=None):
+            return FakeSession()
+
+    # Path caching off, so every call reaches the session.
+    gateway = SkosGraphGateway(Neo4jConfig(uri=None, user=None, password=None, database=None, path_cache_size=0))
+    gateway.driver = FakeDriver()
+
+    with gateway.batch():
+        for _ in range(3):
+            assert gateway.shortest_path("ex:a", "ex:b") is None
+    assert len(opened) == 1
+
+    gateway.shortest_path("ex:a", "ex:b")
+    assert len(opened) == 2
+
+
+def test_search_candidates_batch_runs_one_query_for_all_surfaces():
+    queries = []
+
+    class FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def run(self, query, params=None):
+            queries.append(params)
+            return [
+                {"term": "mango", "iri": "ex:mango", "labels": ["Mango"], "score": 2.0},
+                {"term": "fruit", "iri": "ex:fruit", "labels": [], "score": 1.0},
+            ]
+
+    class FakeDriver:
+        def session(self, database=None):
+            return FakeSession()
+
+    gateway = SkosGraphGateway(Neo4jConfig(uri=None, user=None, password=None, database=None))
+    gateway.driver = FakeDriver()
+
+    results = gateway.search_candidates_batch(["mango", "fruit", "mango", "tree"], limit=3)
+
+    assert len(queries) == 1
+    assert queries[0]["terms"] == ["mango", "fruit", "tree"]
+    assert [(c.iri, c.label) for c in results["mango"]] == [("ex:mango", "Mango")]
+    assert [(c.iri, c.label) for c in results["fruit"]] == [("ex:fruit", "fruit")]
+    assert results["tree"] == []
+
+
+def test_fallback_search_candidates_batch_matches_single_search():
+    gateway = _fallback_gateway()
+
+    results = gateway.search_candidates_batch(["d", "missing", "B", "d"], limit=5)
+
+    assert results == {
+        "d": gateway.search_candidates("d", limit=5),
+        "missing": [],
+        "B": gateway.search_candidates("B", limit=5),
+    }
+    assert gateway.search_candidates_batch(["d"], limit=1) == {"d": gateway.search_candidates("d", limit=1)}
+
+
+def test_neo4j_paths_are_cached_per_unordered_pair():
+    queries = []
+
+    class Node(dict):
+        id = 0
+
+    class Rel:
+        type = "broader"
+
+    class FakeResult:
+        def single(self):
+            return {"nodes": [Node(uri="ex:a"), Node(uri="ex:b")], "rels": [Rel()]}
+
+    class FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def run(self, query, params=None):
+            queries.append(params)
+            return FakeResult()
+
+    class FakeDriver:
+        def session(self, database=None):
+            return FakeSession()
+
+    gateway = SkosGraphGateway(Neo4jConfig(uri=None, user=None, password=None, database=None))
+    gateway.driver = FakeDriver()
+
+    forward = gateway.shortest_path("ex:a", "ex:b")
+    backward = gateway.shortest_paths([("ex:b", "ex:a")])[0]
+
+    assert len(queries) == 1
+    assert [(s.subject_iri, s.object_iri) for s in forward] == [("ex:a", "ex:b")]
+    assert [(s.subject_iri, s.object_iri) for s in backward] == [("ex:b", "ex:a")]
+
+    gateway.shortest_path("ex:a", "ex:b", max_hops=3)
+    gateway.clear_path_cache()
+    gateway.shortest_path("ex:a", "ex:b")
+    assert len(queries) == 3
@@ -43,8 +43,6 @@ def test_generate_sends_payload_and_logs_csv(monkeypatch, tmp_path: Path):
 
         return DummyResponse()
 
-    monkeypatch.setattr("src.infrastructure.ollama_client.requests.post", fake_post)
-
     config = OllamaClientConfig(
         url="http://localhost:11434/api/generate",
         model="llama3:8b",
@@ -52,6 +50,7 @@ def test_generate_sends_payload_and_logs_csv(monkeypatch, tmp_path: Path):
         options=OllamaOptions(seed=7, temperature=0.4, top_k=5, stop="STOP"),
     )
     client = OllamaClient(config=config)
+    monkeypatch.setattr(client._session, "post", fake_post)
 
     result = client.generate(system_prompt="Resolved system", prompt="User text", prompt_name="prompt.txt", input_text="User text")
 
@@ -61,6 +60,7 @@ def test_generate_sends_payload_and_logs_csv(monkeypatch, tmp_path: Path):
     assert captured["json"]["prompt"] == "User text"
     assert captured["json"]["stream"] is False
     assert captured["json"]["options"] == {"seed": 7, "temperature": 0.4, "top_k": 5, "stop": "STOP"}
+    assert "keep_alive" not in captured["json"]
     assert result == sample_response
 
     csv_path = tmp_path / "logs.csv"
@@ -74,3 +74,33 @@ def test_generate_sends_payload_and_logs_csv(monkeypatch, tmp_path: Path):
     assert json.loads(rows[0]["logprobs"])[0]["token"] == "A"
     assert rows[0]["rdf_valid"] == "False"
     assert rows[0]["rdf_note"] == "Response not recognized as RDF/Turtle."
+
+
+def test_generate_sends_keep_alive_when_configured(monkeypatch, tmp_path: Path):
+    captured: dict = {}
+
+    class DummyResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return {"model": "llama3:8b", "response": "ok"}
+
+    def fake_post(url, json=None, **kwargs):  # type: ignore[override]
+        captured["json"] = json
+        return DummyResponse()
+
+    config = OllamaClientConfig(
+        url="http://localhost:11434",
+        model="llama3:8b",
+        csv_path=tmp_path / "logs.csv",
+        options=OllamaOptions(),
+        keep_alive="30m",
+    )
+    client = OllamaClient(config=config)
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    client.generate(system_prompt="System", prompt="Prompt")
+
+    assert captured["json"]["keep_alive"] == "30m"
+    assert "options" not in captured["json"]
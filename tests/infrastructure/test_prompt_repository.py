@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.prompt_repository import PromptRepository
+
+
+def test_load_prompt_is_cached_until_file_changes(tmp_path: Path, monkeypatch):
+    prompt_file = tmp_path / "ner.txt"
+    prompt_file.write_text("first\n", encoding="utf-8")
+    repo = PromptRepository(prompt_dir=tmp_path)
+
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert repo.load_prompt("ner.txt") == "first"
+    assert repo.load_prompt("ner.txt") == "first"
+    assert len(reads) == 1
+
+    prompt_file.write_text("second\n", encoding="utf-8")
+    st = prompt_file.stat()
+    os.utime(prompt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert repo.load_prompt("ner.txt") == "second"
+    assert len(reads) == 2
+
+
+def test_load_prompt_rejects_traversal_and_missing_files(tmp_path: Path):
+    repo = PromptRepository(prompt_dir=tmp_path / "prompts")
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "secret.txt").write_text("nope", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        repo.load_prompt("../secret.txt")
+    with pytest.raises(FileNotFoundError):
+        repo.load_prompt("missing.txt")
+
+
+def test_reload_drops_cached_prompts_and_preload_skips_missing(tmp_path: Path):
+    prompt_file = tmp_path / "ner.txt"
+    prompt_file.write_text("first", encoding="utf-8")
+    repo = PromptRepository(prompt_dir=tmp_path)
+    repo.preload(["ner.txt", "missing.txt", "../outside.txt"])
+
+    # Same mtime, different content: only an explicit reload picks it up.
+    st = prompt_file.stat()
+    prompt_file.write_text("again", encoding="utf-8")
+    os.utime(prompt_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert repo.load_prompt("ner.txt") == "first"
+
+    repo.reload()
+    assert repo.load_prompt("ner.txt") == "again"
@@ -0,0 +1,104 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure import request_logger
+from src.infrastructure.request_logger import RequestLogger
+
+
+def _entries(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_lines_are_buffered_until_flush_size_or_explicit_flush(tmp_path: Path):
+    log_path = tmp_path / "logs" / "requests.jsonl"
+    logger = RequestLogger(log_path, flush_size=3, flush_interval=60)
+
+    logger.log("req-1", "ollama_request", {"stage": "ner"})
+    logger.log_batch("req-1", [("2024-01-01T00:00:00+00:00", "ollama_response", {"text": "Grüße"})])
+    assert _entries(log_path) == []
+
+    logger.log("req-2", "wikidata_request", {"surface": "graph"})
+    assert [entry["event"] for entry in _entries(log_path)] == ["ollama_request", "ollama_response", "wikidata_request"]
+    assert _entries(log_path)[1]["payload"] == {"text": "Grüße"}
+
+    logger.log("req-3", "ollama_request", {})
+    logger.flush()
+    assert [entry["idempotence_key"] for entry in _entries(log_path)] == ["req-1", "req-1", "req-2", "req-3"]
+
+
+def test_pending_lines_are_written_after_flush_interval(tmp_path: Path):
+    log_path = tmp_path / "requests.jsonl"
+    logger = RequestLogger(log_path, flush_size=100, flush_interval=0.05)
+
+    logger.log("req-1", "ollama_request", {})
+
+    deadline = time.monotonic() + 2
+    while not _entries(log_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [entry["event"] for entry in _entries(log_path)] == ["ollama_request"]
+
+
+def test_close_drains_buffer_and_logging_again_reopens(tmp_path: Path):
+    log_path = tmp_path / "requests.jsonl"
+    logger = RequestLogger(log_path, flush_size=100, flush_interval=60)
+
+    logger.log("req-1", "ollama_request", {})
+    logger.close()
+    assert len(_entries(log_path)) == 1
+
+    logger.log("req-2", "ollama_request", {})
+    del logger
+    assert [entry["idempotence_key"] for entry in _entries(log_path)] == ["req-1", "req-2"]
+
+
+def test_datetime_timestamps_are_written_as_utc_iso_strings(tmp_path: Path):
+    log_path = tmp_path / "requests.jsonl"
+    logger = RequestLogger(log_path, flush_size=1)
+
+    logger.log_batch("req-1", [(datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc), "ollama_request", {})])
+    logger.log("req-1", "ollama_response", {})
+
+    first, second = _entries(log_path)
+    assert first["timestamp"] == "2024-01-02T03:04:05.600000Z"
+    assert datetime.fromisoformat(second["timestamp"].replace("Z", "+00:00")).tzinfo is not None
+
+
+def test_log_directory_is_created_up_front_and_recreated_if_removed(tmp_path: Path):
+    log_dir = tmp_path / "logs"
+    logger = RequestLogger(log_dir / "requests.jsonl", flush_size=1)
+    assert log_dir.is_dir()
+
+    log_dir.rmdir()
+    logger.log("req-1", "ollama_request", {})
+
+    assert len(_entries(log_dir / "requests.jsonl")) == 1
+
+
+def test_failed_write_keeps_only_unwritten_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    log_path = tmp_path / "requests.jsonl"
+    logger = RequestLogger(log_path, flush_size=100, flush_interval=60)
+    logger.log("req-1", "first", {})
+    logger.log("req-1", "second", {})
+    real_write = os.write
+    calls = []
+
+    def short_then_fail(fd, data):
+        calls.append(len(data))
+        if len(calls) == 1:
+            return real_write(fd, data[:10])
+        raise OSError("disk full")
+
+    monkeypatch.setattr(request_logger.os, "write", short_then_fail)
+    with pytest.raises(OSError):
+        logger.flush()
+    monkeypatch.setattr(request_logger.os, "write", real_write)
+    logger.flush()
+
+    assert [entry["event"] for entry in _entries(log_path)] == ["first", "second"]
@@ -41,8 +41,8 @@ def test_shortest_path_finds_direct_wikidata_claim(monkeypatch):
     }
 
     def fake_get(url, params=None, **kwargs):  # type: ignore[override]
-        entity_id = params["ids"]
-        return DummyResponse({"entities": {entity_id: entities[entity_id]}})
+        ids = params["ids"].split("|")
+        return DummyResponse({"entities": {entity_id: entities[entity_id] for entity_id in ids}})
 
     monkeypatch.setattr("src.infrastructure.wikidata_client.requests.get", fake_get)
     gateway = WikidataGateway(WikidataConfig(api_url="https://example.test/w/api.php"))
@@ -66,8 +66,8 @@ def test_shortest_path_finds_two_hop_wikidata_claim_path(monkeypatch):
     }
 
     def fake_get(url, params=None, **kwargs):  # type: ignore[override]
-        entity_id = params["ids"]
-        return DummyResponse({"entities": {entity_id: entities[entity_id]}})
+        ids = params["ids"].split("|")
+        return DummyResponse({"entities": {entity_id: entities[entity_id] for entity_id in ids}})
 
     monkeypatch.setattr("src.infrastructure.wikidata_client.requests.get", fake_get)
     gateway = WikidataGateway(WikidataConfig(api_url="https://example.test/w/api.php"))
@@ -88,8 +88,8 @@ def test_shortest_path_respects_hub_threshold(monkeypatch):
     }
 
     def fake_get(url, params=None, **kwargs):  # type: ignore[override]
-        entity_id = params["ids"]
-        return DummyResponse({"entities": {entity_id: entities[entity_id]}})
+        ids = params["ids"].split("|")
+        return DummyResponse({"entities": {entity_id: entities[entity_id] for entity_id in ids}})
 
     monkeypatch.setattr("src.infrastructure.wikidata_client.requests.get", fake_get)
     gateway = WikidataGateway(WikidataConfig(api_url="https://example.test/w/api.php"))
@@ -101,3 +101,33 @@ def test_shortest_path_respects_hub_threshold(monkeypatch):
     )
 
     assert path is None
+
+
+def test_shortest_paths_batches_entity_lookups(monkeypatch):
+    entities = {
+        "Q1": entity("Source", {"P31": [statement("P31", "Q2")]}),
+        "Q2": entity("Target"),
+        "Q3": entity("Other", {"P279": [statement("P279", "Q2")]}),
+    }
+    requested: list[str] = []
+
+    def fake_get(url, params=None, **kwargs):  # type: ignore[override]
+        requested.append(params["ids"])
+        ids = params["ids"].split("|")
+        return DummyResponse({"entities": {entity_id: entities[entity_id] for entity_id in ids}})
+
+    monkeypatch.setattr("src.infrastructure.wikidata_client.requests.get", fake_get)
+    gateway = WikidataGateway(WikidataConfig(api_url="https://example.test/w/api.php"))
+
+    paths = gateway.shortest_paths(
+        [
+            ("http://www.wikidata.org/entity/Q1", "http://www.wikidata.org/entity/Q2"),
+            ("http://www.wikidata.org/entity/Q3", "http://www.wikidata.org/entity/Q2"),
+            ("http://www.wikidata.org/entity/Q2", "http://www.wikidata.org/entity/Q1"),
+        ]
+    )
+
+    assert requested == ["Q1|Q2|Q3"]
+    assert [step.predicate for step in paths[0]] == ["P31"]
+    assert [step.predicate for step in paths[1]] == ["P279"]
+    assert paths[2] is None
@@ -1,17 +1,30 @@
 import json
+import os
 from pathlib import Path
+from unittest import mock
 
+import orjson
 import pytest
 
-from src.app import create_app
-from src.infrastructure import prompt_repository
+from src.infrastructure import ollama_client, prompt_repository, wikidata_client
 from src.domain.models import Candidate, PathStep
 
+_JSON = "application/json"
+_ANALYZE_BODY = orjson.dumps(
+    {"text": "graph theory is important", "prompt_name": "ner.txt", "system_prompt_name": "system.txt", "top_k": 1}
+)
 
-@pytest.fixture()
-def prompt_dir(tmp_path: Path):
-    p = tmp_path / "prompt"
-    p.mkdir()
+
+@pytest.fixture(scope="module")
+def module_monkeypatch():
+    # Function-scoped ``monkeypatch`` cannot back module fixtures; this undoes everything after the module.
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+@pytest.fixture(scope="module")
+def prompt_dir(tmp_path_factory: pytest.TempPathFactory):
+    p = tmp_path_factory.mktemp("prompt")
     (p / "ner.txt").write_text("NER ${USER_TEXT}", encoding="utf-8")
     (p / "system.txt").write_text("System", encoding="utf-8")
     (p / "path.txt").write_text("Path ${PATHS_JSON}", encoding="utf-8")
@@ -20,75 +33,90 @@ def prompt_dir(tmp_path: Path):
     return p
 
 
-@pytest.fixture()
-def patch_prompt_repo(monkeypatch: pytest.MonkeyPatch, prompt_dir: Path):
+@pytest.fixture(scope="module")
+def patch_prompt_repo(module_monkeypatch: pytest.MonkeyPatch, prompt_dir: Path):
     repo_original_init = prompt_repository.PromptRepository.__init__
 
     def _init(self, prompt_dir=None, _default_dir=prompt_dir):
         chosen_dir = _default_dir if prompt_dir is None else prompt_dir
         repo_original_init(self, prompt_dir=chosen_dir)
 
-    monkeypatch.setattr(prompt_repository.PromptRepository, "__init__", _init)
+    module_monkeypatch.setattr(prompt_repository.PromptRepository, "__init__", _init)
 
 
-@pytest.fixture()
-def stub_graph(monkeypatch: pytest.MonkeyPatch):
-    from src.infrastructure import wikidata_client
-
-    def fake_init(self, config, fallback_graph=None):
+class _StubGateway(wikidata_client.WikidataGateway):
+    def __init__(self, config):
         self.config = config
-        self.fallback_graph = None
 
-    def fake_search(self, surface: str, limit: int = 5):
+    def search_candidates(self, surface: str, limit: int = 5):
         return [Candidate(iri="http://example.org/concept/1", label="Graph Theory", score=0.9)]
 
-    def fake_path(self, source_iri: str, target_iri: str, max_hops: int = 2, hub_threshold=None):
+    def shortest_path(self, source_iri: str, target_iri: str, max_hops: int = 2, hub_threshold=None):
         return None
 
-    def fake_health(self):
+    def shortest_paths(self, pairs, max_hops: int = 2, hub_threshold=None):
+        return [None] * len(pairs)
+
+    def health(self):
         return {"status": "ok"}
 
-    monkeypatch.setattr(wikidata_client.WikidataGateway, "__init__", fake_init)
-    monkeypatch.setattr(wikidata_client.WikidataGateway, "search_candidates", fake_search)
-    monkeypatch.setattr(wikidata_client.WikidataGateway, "shortest_path", fake_path)
-    monkeypatch.setattr(wikidata_client.WikidataGateway, "health", fake_health)
 
+_DEFAULT = {"response": "{}"}
+_CANNED = {
+    "ner.txt": {"response": json.dumps({"mentions": [{"surface": "graph theory", "label": "Field", "start": 0, "end": 12, "confidence": 0.9}]})},
+    "path.txt": {"response": json.dumps(["A relates to B"])},
+    "summary.txt": {"response": "Summary text"},
+    "decision.txt": {"response": json.dumps({"iri": "http://example.org/concept/1", "label": "Graph Theory", "score": 0.9})},
+}
 
-@pytest.fixture()
-def stub_ollama(monkeypatch: pytest.MonkeyPatch):
-    from src.infrastructure import ollama_client
 
-    def fake_generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
-        if prompt_name == "ner.txt":
-            return {"response": json.dumps({"mentions": [{"surface": "graph theory", "label": "Field", "start": 0, "end": 12, "confidence": 0.9}]})}
-        if prompt_name == "path.txt":
-            return {"response": json.dumps(["A relates to B"])}
-        if prompt_name == "summary.txt":
-            return {"response": "Summary text"}
-        if prompt_name == "decision.txt":
-            return {"response": json.dumps({"iri": "http://example.org/concept/1", "label": "Graph Theory", "score": 0.9})}
-        return {"response": "{}"}
+class _StubOllamaClient(ollama_client.OllamaClient):
+    def generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
+        return _CANNED.get(prompt_name, _DEFAULT)
 
-    def fake_health(self):
+    def health_check(self):
         return {"status": "ok"}
 
-    monkeypatch.setattr(ollama_client.OllamaClient, "generate", fake_generate)
-    monkeypatch.setattr(ollama_client.OllamaClient, "health_check", fake_health)
 
+@pytest.fixture(scope="module")
+def stub_graph(module_monkeypatch: pytest.MonkeyPatch, app_module):
+    # create_app builds its gateway from the name it imported, so swapping that name is enough.
+    module_monkeypatch.setattr(app_module, "WikidataGateway", _StubGateway)
+
+
+@pytest.fixture(scope="module")
+def stub_ollama(module_monkeypatch: pytest.MonkeyPatch, app_module):
+    module_monkeypatch.setattr(app_module, "OllamaClient", _StubOllamaClient)
+
+
+@pytest.fixture(scope="module")
+def rdf_log(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("logs") / "rdf_results.csv"
+
+
+@pytest.fixture(scope="module")
+def app_env(rdf_log: Path):
+    # One update for the whole module; patch.dict restores os.environ (including anything
+    # load_dotenv adds) when the module is done.
+    env = {
+        "DEFAULT_PROMPT_NAME": "ner.txt",
+        "DEFAULT_SYSTEM_PROMPT_NAME": "system.txt",
+        "PATH_TO_TEXT_PROMPT_NAME": "path.txt",
+        "PATH_SUMMARY_PROMPT_NAME": "summary.txt",
+        "CANDIDATE_DECISION_PROMPT_NAME": "decision.txt",
+        "OLLAMA_API_URL": "http://localhost:11434",
+        "OLLAMA_MODEL": "llama3:8b",
+        "RDF_LOG_PATH": str(rdf_log),
+        # Keep request logs out of the repo's data/ directory.
+        "ANALYZE_LOG_PATH": str(rdf_log.with_name("analyze_log.jsonl")),
+    }
+    with mock.patch.dict(os.environ, env):
+        yield
 
-@pytest.fixture()
-def client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, prompt_dir: Path, patch_prompt_repo, stub_graph, stub_ollama):
-    monkeypatch.setenv("DEFAULT_PROMPT_NAME", "ner.txt")
-    monkeypatch.setenv("DEFAULT_SYSTEM_PROMPT_NAME", "system.txt")
-    monkeypatch.setenv("PATH_TO_TEXT_PROMPT_NAME", "path.txt")
-    monkeypatch.setenv("PATH_SUMMARY_PROMPT_NAME", "summary.txt")
-    monkeypatch.setenv("CANDIDATE_DECISION_PROMPT_NAME", "decision.txt")
-    monkeypatch.setenv("OLLAMA_API_URL", "http://localhost:11434")
-    monkeypatch.setenv("OLLAMA_MODEL", "llama3:8b")
-    rdf_log = tmp_path / "rdf_results.csv"
-    monkeypatch.setenv("RDF_LOG_PATH", str(rdf_log))
 
-    app = create_app()
+@pytest.fixture(scope="module")
+def client(app_factory, app_env, rdf_log: Path, patch_prompt_repo, stub_graph, stub_ollama):
+    app = app_factory()
     app.config.update({"TESTING": True})
 
     with app.test_client() as client:
@@ -97,8 +125,7 @@ def client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, prompt_dir: Path, pa
 
 def test_analyze_request_flow(client):
     client, rdf_log = client
-    payload = {"text": "graph theory is important", "prompt_name": "ner.txt", "system_prompt_name": "system.txt", "top_k": 1}
-    resp = client.post("/analyze", data=json.dumps(payload), content_type="application/json")
+    resp = client.post("/analyze", data=_ANALYZE_BODY, content_type=_JSON)
 
     assert resp.status_code == 200
     data = resp.get_json()
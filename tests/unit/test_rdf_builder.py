@@ -0,0 +1,108 @@
+import orjson
+from rdflib import Graph, Literal, RDF, RDFS, URIRef
+from rdflib.compare import isomorphic
+
+from src.domain.models import Candidate, DisambiguatedMention, PathEvidence
+from src.infrastructure.rdf_builder import RDFBuilder
+
+
+def _mentions() -> list[DisambiguatedMention]:
+    mango = Candidate(iri="http://www.wikidata.org/entity/Q1054564", label='Mango "fruit"\nplant', score=1.0)
+    fruit = Candidate(iri="http://www.wikidata.org/entity/Q1364", label="fruit", score=1.0)
+    return [
+        DisambiguatedMention(
+            surface="Mango",
+            label="Object",
+            start=0,
+            end=5,
+            confidence=0.9,
+            chosen=mango,
+            evidence=PathEvidence(paths=[], summary="Mango relates to fruit"),
+        ),
+        DisambiguatedMention(surface="fruit", label="Object", start=15, end=20, confidence=0.9, chosen=fruit, evidence=None),
+        # Same concept again: duplicate hasTopic/label triples must collapse.
+        DisambiguatedMention(surface="mango", label="Object", start=None, end=None, confidence=0.5, chosen=mango, evidence=None),
+    ]
+
+
+def test_turtle_and_jsonld_describe_the_same_graph():
+    result = RDFBuilder(base_namespace="http://example.org/").build("Mango is not a fruit from a tree", _mentions())
+
+    turtle_graph = Graph().parse(data=result.turtle, format="turtle")
+    jsonld_graph = Graph().parse(data=orjson.dumps(result.jsonld), format="json-ld")
+
+    assert isomorphic(turtle_graph, jsonld_graph)
+    document = URIRef(result.document_uri)
+    mango = URIRef("http://www.wikidata.org/entity/Q1054564")
+    assert (document, RDF.type, URIRef("http://example.org/Document")) in turtle_graph
+    assert len(list(turtle_graph.objects(document, URIRef("http://example.org/hasTopic")))) == 2
+    assert (mango, RDFS.label, Literal('Mango "fruit"\nplant')) in turtle_graph
+    assert len(list(turtle_graph.subjects(RDF.type, URIRef("http://example.org/Mention")))) == 3
+    assertion = next(turtle_graph.subjects(RDF.type, URIRef("http://example.org/Assertion")))
+    assert turtle_graph.value(assertion, URIRef("http://example.org/negated")).toPython() is True
+    assert turtle_graph.value(assertion, URIRef("http://example.org/subject")) == mango
+
+
+def test_turtle_uses_prefixed_names_only_for_simple_local_parts():
+    result = RDFBuilder(base_namespace="http://example.org/").build("Mango is not a fruit from a tree", _mentions())
+
+    assert "a ex:Document" in result.turtle
+    assert "ex:negated true" in result.turtle
+    assert "ex:startOffset 0" in result.turtle
+    assert f"<{result.document_uri}>" in result.turtle
+    assert "<http://www.wikidata.org/entity/Q1364>" in result.turtle
+
+
+def test_literal_equal_to_an_iri_is_kept_as_a_literal():
+    iri = "http://www.wikidata.org/entity/Q1364"
+    mention = DisambiguatedMention(
+        surface=iri,
+        label="Object",
+        start=None,
+        end=None,
+        confidence=None,
+        chosen=Candidate(iri=iri, label=iri, score=1.0),
+        evidence=None,
+    )
+
+    result = RDFBuilder().build("no copula here", [mention])
+    graph = Graph().parse(data=result.turtle, format="turtle")
+
+    assert (URIRef(iri), RDFS.label, Literal(iri)) in graph
+    assert graph.value(URIRef(result.document_uri), URIRef("http://example.org/hasTopic")) == URIRef(iri)
+
+
+def test_document_uri_uses_supplied_id_or_short_text_digest():
+    builder = RDFBuilder(base_namespace="http://example.org/")
+
+    hashed = builder.build("Mango is a fruit", [])
+    keyed = builder.build("Mango is a fruit", [], document_id="req 1/a")
+
+    assert hashed.document_uri == builder.build("Mango is a fruit", []).document_uri
+    assert len(hashed.document_uri.rsplit("/", 1)[1]) == 32
+    assert keyed.document_uri == "http://example.org/Document/req%201%2Fa"
+
+
+def test_hostile_concept_iri_is_dropped_instead_of_injecting_triples():
+    hostile = 'http://e/x> <http://e/p> "pwn" . <http://e/y'
+    mentions = [
+        DisambiguatedMention(
+            surface="Mango",
+            label="Object",
+            start=0,
+            end=5,
+            confidence=0.9,
+            chosen=Candidate(iri=hostile, label="Mango", score=1.0),
+            evidence=None,
+        )
+    ]
+
+    result = RDFBuilder().build("Mango is not a fruit", mentions)
+    graph = Graph().parse(data=result.turtle, format="turtle")
+
+    assert "pwn" not in result.turtle
+    assert (None, URIRef("http://e/p"), None) not in graph
+    assert list(graph.objects(URIRef(result.document_uri), URIRef("http://example.org/hasTopic"))) == []
+    assertion = next(graph.subjects(RDF.type, URIRef("http://example.org/Assertion")))
+    assert graph.value(assertion, URIRef("http://example.org/subject")) is None
+    assert isomorphic(graph, Graph().parse(data=orjson.dumps(result.jsonld), format="json-ld"))
@@ -1,10 +1,21 @@
+import csv
 import json
+from collections import namedtuple
 from pathlib import Path
 
-from src.application.services import KnowledgeGraphService
-from src.domain.models import AnalyzeRequest, Candidate, PathStep
+from src.application.services import KnowledgeGraphService, _fill_template, _paths_json
+from src.domain.models import AnalyzeRequest, Candidate, Mention, MentionCandidates, MentionExtraction, PathStep
+from src.infrastructure.neo4j_client import Neo4jConfig, SkosGraphGateway
 from src.infrastructure.rdf_builder import RDFBuilder
 from src.infrastructure.prompt_repository import PromptRepository
+from src.infrastructure.request_logger import RequestLogger
+
+_Call = namedtuple("_Call", "system prompt_name prompt input_text")
+_DEFAULT = {"response": "{}"}
+_CANDIDATES = (
+    Candidate(iri="http://example.org/concept/1", label="Graph Theory", score=0.9),
+    Candidate(iri="http://example.org/concept/2", label="Networks", score=0.8),
+)
 
 
 class DummyPromptRepo(PromptRepository):
@@ -17,20 +28,19 @@ class DummyPromptRepo(PromptRepository):
 
 
 class StubOllamaClient:
-    def __init__(self):
+    def __init__(self, canned: dict[str, dict] | None = None):
         self.calls = []
+        # Responses are constant per prompt, so encode them once and dispatch on the prompt name.
+        self._canned = canned if canned is not None else {
+            "ner": {"response": json.dumps({"mentions": [{"surface": "graph theory", "label": "Field", "start": 0, "end": 12, "confidence": 0.9}]})},
+            "path": {"response": json.dumps(["A relates to B"])},
+            "summary": {"response": "Summary of paths"},
+            "decision": {"response": json.dumps({"iri": "http://example.org/concept/1", "label": "Graph Theory", "score": 0.95})},
+        }
 
     def generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
-        self.calls.append({"system": system_prompt, "prompt_name": prompt_name, "prompt": prompt, "input_text": input_text})
-        if prompt_name == "ner":
-            return {"response": json.dumps({"mentions": [{"surface": "graph theory", "label": "Field", "start": 0, "end": 12, "confidence": 0.9}]})}
-        if prompt_name == "path":
-            return {"response": json.dumps(["A relates to B"])}
-        if prompt_name == "summary":
-            return {"response": "Summary of paths"}
-        if prompt_name == "decision":
-            return {"response": json.dumps({"iri": "http://example.org/concept/1", "label": "Graph Theory", "score": 0.95})}
-        return {"response": "{}"}
+        self.calls.append(_Call(system_prompt, prompt_name, prompt, input_text))
+        return self._canned.get(prompt_name, _DEFAULT)
 
     def health_check(self):
         return {"status": "ok"}
@@ -43,10 +53,8 @@ class StubGraphGateway:
 
     def search_candidates(self, surface: str, limit: int = 5):
         self.search_calls.append({"surface": surface, "limit": limit})
-        return [
-            Candidate(iri="http://example.org/concept/1", label="Graph Theory", score=0.9),
-            Candidate(iri="http://example.org/concept/2", label="Networks", score=0.8),
-        ]
+        # A fresh list per call: the service caches what it gets back.
+        return list(_CANDIDATES)
 
     def shortest_path(self, source_iri: str, target_iri: str, max_hops: int = 2, hub_threshold=None):
         self.path_calls.append({"source": source_iri, "target": target_iri, "max_hops": max_hops, "hub_threshold": hub_threshold})
@@ -56,6 +64,31 @@ class StubGraphGateway:
         return {"status": "ok"}
 
 
+_PROMPTS = {
+    "ner": "NER ${USER_TEXT}",
+    "system": "System prompt",
+    "path": "Paths ${PATHS_JSON}",
+    "summary": "Summary ${PATH_SENTENCES_JSON}",
+    "decision": "Decision ${CANDIDATES_JSON}",
+}
+
+
+def _make_service(prompts: dict[str, str] | None = None, **overrides) -> KnowledgeGraphService:
+    """Build a service wired to the stubs above; keyword arguments override any constructor argument."""
+    kwargs = {
+        "default_prompt": "ner",
+        "default_system_prompt": "system",
+        "path_to_text_prompt": "path",
+        "path_summary_prompt": "summary",
+        "candidate_decision_prompt": "decision",
+        "ollama_client": StubOllamaClient(),
+        "graph_gateway": StubGraphGateway(),
+        "rdf_builder": RDFBuilder(base_namespace="http://example.org/"),
+    }
+    kwargs.update(overrides)
+    return KnowledgeGraphService(prompt_repository=DummyPromptRepo(prompts=_PROMPTS if prompts is None else prompts), **kwargs)
+
+
 def test_analyze_pipeline_builds_rdf(tmp_path: Path):
     prompts = {
         "ner": "NER ${USER_TEXT}",
@@ -109,18 +142,13 @@ def test_analyze_adds_heuristic_mentions_and_negated_copula_rdf(tmp_path: Path):
         "decision": "Decision ${CANDIDATES_JSON}",
     }
 
-    class MentionPoorOllama(StubOllamaClient):
-        def generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
-            self.calls.append({"system": system_prompt, "prompt_name": prompt_name, "prompt": prompt, "input_text": input_text})
-            if prompt_name == "ner":
-                return {"response": json.dumps({"mentions": [{"surface": "Mango", "label": "Object", "start": 0, "end": 5, "confidence": 0.95}]})}
-            if prompt_name == "path":
-                return {"response": json.dumps([])}
-            if prompt_name == "summary":
-                return {"response": ""}
-            if prompt_name == "decision":
-                return {"response": "{}"}
-            return {"response": "{}"}
+    mention_poor_ollama = StubOllamaClient(
+        canned={
+            "ner": {"response": json.dumps({"mentions": [{"surface": "Mango", "label": "Object", "start": 0, "end": 5, "confidence": 0.95}]})},
+            "path": {"response": json.dumps([])},
+            "summary": {"response": ""},
+        }
+    )
 
     class SurfaceAwareGateway(StubGraphGateway):
         def search_candidates(self, surface: str, limit: int = 5):
@@ -134,7 +162,7 @@ def test_analyze_adds_heuristic_mentions_and_negated_copula_rdf(tmp_path: Path):
             return [candidate]
 
     repo = DummyPromptRepo(prompts=prompts)
-    ollama = MentionPoorOllama()
+    ollama = mention_poor_ollama
     graph = SurfaceAwareGateway()
     rdf_builder = RDFBuilder(base_namespace="http://example.org/")
     service = KnowledgeGraphService(
@@ -172,12 +200,9 @@ def test_analyze_falls_back_when_ner_json_is_truncated(tmp_path: Path):
         "decision": "Decision ${CANDIDATES_JSON}",
     }
 
-    class TruncatedNerOllama(StubOllamaClient):
-        def generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
-            self.calls.append({"system": system_prompt, "prompt_name": prompt_name, "prompt": prompt, "input_text": input_text})
-            if prompt_name == "ner":
-                return {"response": '{"mentions": [{"surface": "Question rewriting", "label": "Task", "start": 0'}
-            return {"response": "{}"}
+    truncated_ner_ollama = StubOllamaClient(
+        canned={"ner": {"response": '{"mentions": [{"surface": "Question rewriting", "label": "Task", "start": 0'}}
+    )
 
     class AnySurfaceGateway(StubGraphGateway):
         def search_candidates(self, surface: str, limit: int = 5):
@@ -191,7 +216,7 @@ def test_analyze_falls_back_when_ner_json_is_truncated(tmp_path: Path):
         path_to_text_prompt="path",
         path_summary_prompt="summary",
         candidate_decision_prompt="decision",
-        ollama_client=TruncatedNerOllama(),
+        ollama_client=truncated_ner_ollama,
         graph_gateway=AnySurfaceGateway(),
         rdf_builder=RDFBuilder(base_namespace="http://example.org/"),
         rdf_log_path=tmp_path / "rdf_log.csv",
@@ -203,3 +228,280 @@ def test_analyze_falls_back_when_ner_json_is_truncated(tmp_path: Path):
 
     assert response.mentions.mentions
     assert "Question" in response.rdf.turtle or "rewriting" in response.rdf.turtle
+
+
+def test_candidate_search_is_cached_across_requests():
+    graph = StubGraphGateway()
+    service = _make_service(graph_gateway=graph)
+
+    request = AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system", top_k=2)
+    first = service.analyze(request)
+    second = service.analyze(request)
+
+    assert graph.search_calls == [{"surface": "graph theory", "limit": 2}]
+    assert second.candidate_selections[0].candidates == first.candidate_selections[0].candidates
+
+
+class SymmetricGraphGateway(StubGraphGateway):
+    symmetric_paths = True
+
+
+def test_symmetric_gateway_searches_each_pair_once():
+    directed = StubGraphGateway()
+    symmetric = SymmetricGraphGateway()
+    for graph in (directed, symmetric):
+        service = _make_service(graph_gateway=graph, path_candidate_limit=2, path_within_mentions=True, enable_paths=True)
+        service.analyze(AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system", top_k=2))
+
+    assert [(call["source"], call["target"]) for call in directed.path_calls] == [
+        ("http://example.org/concept/1", "http://example.org/concept/2"),
+        ("http://example.org/concept/2", "http://example.org/concept/1"),
+    ]
+    assert [(call["source"], call["target"]) for call in symmetric.path_calls] == [
+        ("http://example.org/concept/1", "http://example.org/concept/2"),
+    ]
+
+
+def test_llm_decisions_keep_mention_order_when_run_concurrently():
+    prompts = {**_PROMPTS, "decision": "${SURFACE}"}
+
+    mentions = [
+        {"surface": "alpha", "label": "Thing", "start": 0, "end": 5, "confidence": 0.9},
+        {"surface": "beta", "label": "Thing", "start": 6, "end": 10, "confidence": 0.9},
+        {"surface": "gamma", "label": "Thing", "start": 11, "end": 16, "confidence": 0.9},
+    ]
+
+    class SurfaceEchoOllama(StubOllamaClient):
+        # Decisions echo the prompt back, so only they need a handler; everything else is canned.
+        def generate(self, system_prompt: str, prompt: str, prompt_name: str | None = None, input_text: str | None = None):
+            if prompt_name != "decision":
+                return super().generate(system_prompt, prompt, prompt_name, input_text)
+            self.calls.append(_Call(system_prompt, prompt_name, prompt, input_text))
+            return {"response": json.dumps({"iri": f"http://example.org/{prompt}", "label": prompt})}
+
+    service = _make_service(
+        prompts,
+        ollama_client=SurfaceEchoOllama(canned={"ner": {"response": json.dumps({"mentions": mentions})}}),
+        candidate_decision_mode="llm",
+        decision_workers=3,
+    )
+
+    response = service.analyze(AnalyzeRequest(text="alpha beta gamma", prompt_name="ner", system_prompt_name="system"))
+
+    assert [d.surface for d in response.disambiguation] == ["alpha", "beta", "gamma"]
+    assert [d.chosen.label for d in response.disambiguation] == ["alpha", "beta", "gamma"]
+
+
+def test_request_events_are_flushed_once_per_request(tmp_path: Path):
+    class CountingLogger(RequestLogger):
+        def __init__(self, log_path: Path):
+            super().__init__(log_path)
+            self.batches = 0
+
+        def log_batch(self, idempotence_key, events):
+            self.batches += 1
+            super().log_batch(idempotence_key, events)
+
+    logger = CountingLogger(tmp_path / "requests.jsonl")
+    service = _make_service(request_logger=logger)
+
+    # The copula heuristic adds a second mention, so candidate search runs on worker threads.
+    service.analyze(AnalyzeRequest(text="graph theory is a field", prompt_name="ner", system_prompt_name="system", idempotence_key="req-1"))
+    logger.flush()
+
+    entries = [json.loads(line) for line in (tmp_path / "requests.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert logger.batches == 1
+    assert {entry["idempotence_key"] for entry in entries} == {"req-1"}
+    searches = [e for e in entries if e["event"] == "wikidata_request" and e["payload"].get("stage") == "candidate_selection"]
+    assert len(searches) >= 2
+
+
+def test_request_log_failure_does_not_replace_the_result(tmp_path: Path, caplog):
+    class FullDiskLogger(RequestLogger):
+        def log_batch(self, idempotence_key, events):
+            raise OSError("disk full")
+
+    service = _make_service(request_logger=FullDiskLogger(tmp_path / "requests.jsonl"))
+
+    response = service.analyze(AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system", idempotence_key="req-1"))
+
+    assert response.disambiguation[0].chosen.label == "Graph Theory"
+    assert "req-1" in caplog.text
+
+
+def test_rdf_log_appends_one_row_per_request(tmp_path: Path):
+    rdf_log_path = tmp_path / "logs" / "rdf_log.csv"
+    service = _make_service(rdf_log_path=rdf_log_path)
+
+    request = AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system")
+    service.analyze(request)
+    service.analyze(request)
+    service.close()
+
+    with rdf_log_path.open(encoding="utf-8", newline="") as fp:
+        rows = list(csv.DictReader(fp))
+    assert len(rows) == 2
+    assert all(row["input_text"] == "graph theory advances" and row["rdf_valid"] == "True" for row in rows)
+
+
+def test_paths_to_text_translates_paths_in_batches():
+    ollama = StubOllamaClient()
+    service = _make_service(ollama_client=ollama, path_translation_batch_size=2)
+    step = PathStep(
+        subject_iri="http://example.org/concept/1",
+        subject_label="Graph Theory",
+        predicate="related",
+        object_iri="http://example.org/concept/2",
+        object_label="Networks",
+    )
+
+    sentences, generations = service._paths_to_text([[step]] * 3, "System prompt", idempotence_key="req-1")
+
+    assert sentences == ["A relates to B", "A relates to B"]
+    assert len(generations) == 2
+    assert sorted(call.prompt.count('"predicate"') for call in ollama.calls) == [1, 2]
+
+
+def test_paths_to_text_without_paths_reports_no_generation():
+    ollama = StubOllamaClient()
+    service = _make_service(ollama_client=ollama)
+
+    assert service._paths_to_text([], "System prompt", idempotence_key="req-1") == ([], None)
+    response = service.analyze(AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system"))
+    assert response.generation["path_translation"] is None
+    assert "path" not in [call.prompt_name for call in ollama.calls]
+
+
+def test_compute_paths_skips_duplicate_and_self_pairs():
+    directed = StubGraphGateway()
+    symmetric = SymmetricGraphGateway()
+    # Both mentions resolve to the same two candidates.
+    selections = [
+        MentionCandidates(surface=surface, candidates=directed.search_candidates(surface, limit=2))
+        for surface in ("graph theory", "networks")
+    ]
+    for graph in (directed, symmetric):
+        service = _make_service(graph_gateway=graph, path_candidate_limit=2, enable_paths=True)
+        service._compute_paths(selections, max_hops=2, hub_threshold=None, idempotence_key="req-1")
+
+    assert [(call["source"], call["target"]) for call in directed.path_calls] == [
+        ("http://example.org/concept/1", "http://example.org/concept/2"),
+        ("http://example.org/concept/2", "http://example.org/concept/1"),
+    ]
+    assert [(call["source"], call["target"]) for call in symmetric.path_calls] == [
+        ("http://example.org/concept/1", "http://example.org/concept/2"),
+    ]
+
+
+def test_fallback_graph_paths_are_searched_in_both_orientations():
+    # Only b -> a is stored; the directed fallback BFS finds it only from b's side.
+    graph = SkosGraphGateway(
+        Neo4jConfig(uri=None, user=None, password=None, database=None),
+        fallback_graph={"ex:a": [], "ex:b": [("broader", "ex:a", "A")]},
+    )
+    service = _make_service(graph_gateway=graph, enable_paths=True)
+    selections = [
+        MentionCandidates(surface="a", candidates=[Candidate(iri="ex:a", label="A", score=1.0)]),
+        MentionCandidates(surface="b", candidates=[Candidate(iri="ex:b", label="B", score=1.0)]),
+    ]
+
+    paths = service._compute_paths(selections, max_hops=2, hub_threshold=None, idempotence_key="req-1")
+
+    assert not graph.symmetric_paths
+    assert [[(step.subject_iri, step.object_iri) for step in path] for path in paths] == [[("ex:b", "ex:a")]]
+
+
+def test_fill_template_substitutes_placeholders_in_one_pass():
+    template = "Surface ${SURFACE} in ${CONTEXT}; keep ${UNKNOWN} and $5"
+
+    filled = _fill_template(template, SURFACE="graph ${CONTEXT}", CONTEXT="text")
+
+    assert filled == "Surface graph ${CONTEXT} in text; keep ${UNKNOWN} and $5"
+
+
+def test_short_paths_are_verbalized_without_llm_calls():
+    class OneHopGateway(SymmetricGraphGateway):
+        readable_predicates = True
+
+        def shortest_path(self, source_iri: str, target_iri: str, max_hops: int = 2, hub_threshold=None):
+            super().shortest_path(source_iri, target_iri, max_hops=max_hops, hub_threshold=hub_threshold)
+            return [PathStep(subject_iri=source_iri, subject_label="Graph Theory", predicate="related", object_iri=target_iri, object_label="Networks")]
+
+    ollama = StubOllamaClient()
+    service = _make_service(
+        ollama_client=ollama, graph_gateway=OneHopGateway(), path_candidate_limit=2, path_within_mentions=True, enable_paths=True
+    )
+
+    response = service.analyze(AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system", top_k=2))
+
+    assert [call.prompt_name for call in ollama.calls] == ["ner"]
+    assert response.disambiguation[0].evidence.summary == "Graph Theory related Networks."
+    assert response.generation["path_summary"] is None
+    assert response.generation["path_translation"] is None
+
+    class PropertyIdGateway(OneHopGateway):
+        readable_predicates = False
+
+    ollama = StubOllamaClient()
+    service.ollama_client = ollama
+    service.graph_gateway = PropertyIdGateway()
+
+    service.analyze(AnalyzeRequest(text="graph theory advances", prompt_name="ner", system_prompt_name="system", top_k=2))
+
+    assert [call.prompt_name for call in ollama.calls][:3] == ["ner", "path", "summary"]
+
+
+def test_repeated_surfaces_are_searched_once_per_request():
+    graph = StubGraphGateway()
+    service = _make_service(graph_gateway=graph, candidate_cache_size=0)
+    mentions = MentionExtraction(
+        mentions=[
+            Mention(surface="Graph theory", label=None, start=0, end=12, confidence=None),
+            Mention(surface="networks", label=None, start=20, end=28, confidence=None),
+            Mention(surface="graph theory", label=None, start=40, end=52, confidence=None),
+        ]
+    )
+
+    selections = service._select_candidates(mentions, top_k=2, idempotence_key="req-1")
+
+    assert sorted(call["surface"] for call in graph.search_calls) == ["Graph theory", "networks"]
+    assert [selection.surface for selection in selections] == ["Graph theory", "networks", "graph theory"]
+    assert selections[0].candidates == selections[2].candidates
+    assert selections[0].candidates is not selections[2].candidates
+
+
+def test_batch_search_gateway_is_queried_once_for_uncached_surfaces():
+    class BatchGraphGateway(StubGraphGateway):
+        def __init__(self):
+            super().__init__()
+            self.batch_calls = []
+
+        def search_candidates_batch(self, surfaces, limit=5):
+            self.batch_calls.append(list(surfaces))
+            return {surface: self.search_candidates(surface, limit) for surface in surfaces}
+
+    graph = BatchGraphGateway()
+    service = _make_service(graph_gateway=graph)
+    first = MentionExtraction(mentions=[Mention(surface="Graph theory", label=None, start=0, end=12, confidence=None)])
+    second = MentionExtraction(
+        mentions=[
+            Mention(surface="graph theory", label=None, start=0, end=12, confidence=None),
+            Mention(surface="networks", label=None, start=20, end=28, confidence=None),
+            Mention(surface="Trees", label=None, start=30, end=35, confidence=None),
+        ]
+    )
+
+    service._select_candidates(first, top_k=2, idempotence_key="req-1")
+    selections = service._select_candidates(second, top_k=2, idempotence_key="req-2")
+
+    assert graph.batch_calls == [["Graph theory"], ["networks", "Trees"]]
+    assert [len(selection.candidates) for selection in selections] == [2, 2, 2]
+
+
+def test_paths_json_matches_serializing_the_paths_directly():
+    shared = PathStep(subject_iri="ex:a", subject_label="A", predicate="broader", object_iri="ex:b", object_label=None)
+    other = PathStep(subject_iri="ex:b", subject_label=None, predicate="related", object_iri="ex:c", object_label='C "q"')
+    paths = [[shared], [shared, other], []]
+
+    assert json.loads(_paths_json(paths)) == [[step.to_dict() for step in path] for path in paths]
+    assert _paths_json([]) == "[]"